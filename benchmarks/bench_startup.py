@@ -0,0 +1,89 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFERRED_MODULES = ("requests", "urllib3", "urllib.request", "http.client", "ssl", "numpy", "yacht_solver")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        name = raw_name.strip()
+        depth = len(raw_name) - len(raw_name.lstrip())
+        entries.append((name, depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def module_subtree(entries: list[tuple[str, int, int, int]], module: str) -> dict[str, int]:
+    index = max(idx for idx, entry in enumerate(entries) if entry[0] == module)
+    root_depth = entries[index][1]
+    subtree = {module: entries[index][3]}
+    for name, depth, _, cumulative in reversed(entries[:index]):
+        if depth <= root_depth:
+            break
+        subtree[name] = cumulative
+    return subtree
+
+
+def measure_import(module: str = "weather_yacht") -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return module_subtree(parse_importtime(result.stderr), module)
+
+
+def run(repeat: int = 5, module: str = "weather_yacht", warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        measure_import(module)
+    samples = [measure_import(module) for _ in range(repeat)]
+    totals = [sample[module] for sample in samples]
+    last = samples[-1]
+    heaviest = sorted(
+        ((name, cumulative) for name, cumulative in last.items() if name != module),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+    return {
+        "module": module,
+        "repeat": repeat,
+        "import_ms_median": statistics.median(totals) / 1000,
+        "import_ms_min": min(totals) / 1000,
+        "heaviest_ms": {name: cumulative / 1000 for name, cumulative in heaviest},
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in last],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="python -X importtime으로 weather_yacht 시작 import 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--module", default="weather_yacht")
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    result = run(args.repeat, args.module)
+    print(f"{result['module']} import: 중앙값 {result['import_ms_median']:.1f}ms, 최소 {result['import_ms_min']:.1f}ms")
+    for name, elapsed in result["heaviest_ms"].items():
+        print(f"  {elapsed:8.1f}ms  {name}")
+    if result["deferred_loaded"]:
+        print(f"시작 시 불러오면 안 되는 모듈이 로드됨: {', '.join(result['deferred_loaded'])}")
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    if result["deferred_loaded"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from yacht_rules import CATEGORIES, calculate_score, classify_weather  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.3
+ALL_ROLLS = [list(roll) for roll in itertools.product(range(1, 7), repeat=5)]
+WEATHER_CODES = list(range(100))
+
+
+class SkipBenchmark(Exception):
+    pass
+
+
+def best_time(func, repeat: int) -> float:
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_calculate_score(repeat: int) -> dict:
+    codes = [code for code, _ in CATEGORIES]
+
+    def run() -> None:
+        for dice in ALL_ROLLS:
+            for code in codes:
+                calculate_score(code, dice)
+
+    seconds = best_time(run, repeat)
+    calls = len(ALL_ROLLS) * len(codes)
+    return {"seconds": seconds, "ops": calls, "ops_per_sec": calls / seconds}
+
+
+def bench_classify_weather(repeat: int) -> dict:
+    codes = WEATHER_CODES * 100
+
+    def run() -> None:
+        for code in codes:
+            classify_weather(code)
+
+    seconds = best_time(run, repeat)
+    return {"seconds": seconds, "ops": len(codes), "ops_per_sec": len(codes) / seconds}
+
+
+def bench_simulation(repeat: int) -> dict:
+    from yacht_tournament import play_games
+
+    games = 200
+
+    def run() -> None:
+        play_games("greedy", "reroll_selected", "benchmark", games, None)
+
+    seconds = best_time(run, repeat)
+    return {"seconds": seconds, "ops": games, "ops_per_sec": games / seconds}
+
+
+def bench_city_suggest(repeat: int) -> dict:
+    from yacht_cities import CityIndex, bundled_cities
+
+    index = CityIndex()
+    prefixes = [
+        name[:length]
+        for city in bundled_cities()
+        for name in city[:2]
+        for length in range(1, len(name) + 1)
+    ]
+
+    def run() -> None:
+        for prefix in prefixes:
+            index.suggest(prefix)
+
+    seconds = best_time(run, repeat)
+    return {"seconds": seconds, "ops": len(prefixes), "ops_per_sec": len(prefixes) / seconds}
+
+
+def open_tk_root():
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        raise SkipBenchmark(f"Tk 디스플레이를 사용할 수 없습니다: {exc}") from exc
+    root.withdraw()
+    return root
+
+
+def bench_dice_render(repeat: int) -> dict:
+    from weather_yacht import DiceView
+
+    root = open_tk_root()
+    try:
+        views = [DiceView(root, index=idx, command=None, size=110) for idx in range(5)]
+        rng = random.Random(0)
+        frames = [
+            [(rng.randint(1, 6), rng.random() < 0.3) for _ in views]
+            for _ in range(200)
+        ]
+
+        def run() -> None:
+            for frame in frames:
+                for view, (value, held) in zip(views, frame):
+                    view.render(value, held, "#202020")
+            root.update_idletasks()
+
+        seconds = best_time(run, repeat)
+    finally:
+        root.destroy()
+    renders = len(frames) * 5
+    return {"seconds": seconds, "ops": renders, "ops_per_sec": renders / seconds}
+
+
+def bench_setup_scoreboard(repeat: int) -> dict:
+    from weather_yacht import WeatherYachtApp
+
+    root = open_tk_root()
+    try:
+        app = WeatherYachtApp(root)
+        app.ensure_frame("game")
+        rosters = [[f"P{idx}" for idx in range(count)] for count in (2, 4, 3, 1, 4)]
+
+        def run() -> None:
+            for names in rosters:
+                app.engine.new_game(names)
+                app.setup_scoreboard()
+            root.update_idletasks()
+
+        seconds = best_time(run, repeat)
+        app.shutdown()
+    finally:
+        root.destroy()
+    return {"seconds": seconds, "ops": len(rosters), "ops_per_sec": len(rosters) / seconds}
+
+
+def bench_startup_import(repeat: int) -> dict:
+    from bench_startup import run
+
+    result = run(max(7, repeat * 2))
+    seconds = result["import_ms_median"] / 1000
+    return {"seconds": seconds, "ops": 1, "ops_per_sec": 1 / seconds}
+
+
+BENCHMARKS = {
+    "calculate_score_all_rolls": bench_calculate_score,
+    "classify_weather": bench_classify_weather,
+    "simulation_greedy_games": bench_simulation,
+    "city_suggest": bench_city_suggest,
+    "startup_import": bench_startup_import,
+    "dice_view_render": bench_dice_render,
+    "setup_scoreboard": bench_setup_scoreboard,
+}
+
+
+def run_benchmarks(names: list[str], repeat: int) -> dict:
+    results = {}
+    for name in names:
+        try:
+            results[name] = BENCHMARKS[name](repeat)
+        except SkipBenchmark as exc:
+            results[name] = {"skipped": str(exc)}
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if "seconds" not in result or not reference or "seconds" not in reference:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        result["baseline_ratio"] = round(ratio, 3)
+        limit = 1 + reference.get("threshold", threshold)
+        if ratio > limit:
+            regressions.append(f"{name}: 기준보다 {ratio:.2f}배 느림 (허용 {limit:.2f}배)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Weather Yacht 성능 벤치마크")
+    parser.add_argument("names", nargs="*", help=f"실행할 벤치마크 (기본: 전체) {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 느려짐 비율 (0.3 = 30%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(unknown)}")
+    names = args.names or list(BENCHMARKS)
+
+    os.environ.setdefault("WEATHER_YACHT_DATA_DIR", tempfile.mkdtemp(prefix="weather-yacht-bench-"))
+    results = run_benchmarks(names, args.repeat)
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("results", {})
+    regressions = compare(results, baseline, args.threshold)
+
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<28} 건너뜀: {result['skipped']}")
+            continue
+        ratio = f"  기준 대비 {result['baseline_ratio']:.2f}배" if "baseline_ratio" in result else ""
+        print(f"{name:<28}{result['seconds'] * 1000:>10.2f}ms{result['ops_per_sec']:>14,.0f}/s{ratio}")
+
+    payload = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        merged = {**baseline, **{name: result for name, result in results.items() if "seconds" in result}}
+        for name, result in merged.items():
+            result.pop("baseline_ratio", None)
+            if "threshold" in baseline.get(name, {}):
+                result["threshold"] = baseline[name]["threshold"]
+        baseline_path.write_text(
+            json.dumps({**payload, "results": merged}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        print(f"기준값을 갱신했습니다: {baseline_path}")
+    elif regressions:
+        print("\n".join(["성능 저하:", *regressions]), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import unittest
+
+from yacht_engine import DICE_COUNT, ROLLS_PER_TURN, GameEngine, GameRuleError, GameState
+from yacht_rules import CATEGORIES, RAIN_BONUS
+
+
+def make_engine(names=("가", "나"), ability_key: str = "reroll_selected", player_abilities=None) -> GameEngine:
+    engine = GameEngine(seed=7)
+    engine.new_game(list(names), ability_key, player_abilities)
+    return engine
+
+
+def score_turn(engine: GameEngine, dice: list[int], category: str) -> int:
+    engine.state.dice = list(dice)
+    score = engine.record_score(category)
+    engine.advance_turn()
+    return score
+
+
+class TurnTrackingTest(unittest.TestCase):
+    def test_leaders_follow_running_totals(self) -> None:
+        engine = make_engine(("가", "나", "다"))
+        state = engine.state
+        self.assertEqual(state.leaders, {0, 1, 2})
+
+        score_turn(engine, [6, 6, 6, 6, 6], "yacht")
+        self.assertEqual((state.leaders, state.best_total), ({0}, 50))
+        score_turn(engine, [6, 6, 6, 6, 6], "yacht")
+        self.assertEqual((state.leaders, state.best_total), ({0, 1}, 50))
+        score_turn(engine, [1, 1, 2, 3, 4], "ones")
+        self.assertEqual((state.leaders, state.best_total), ({0, 1}, 50))
+        self.assertEqual(state.current_player_index, 0)
+        score_turn(engine, [1, 2, 3, 4, 5], "large_straight")
+        self.assertEqual((state.leaders, state.best_total), ({0}, 90))
+
+        winners, best = engine.winners()
+        self.assertEqual(([player.name for player in winners], best), (["가"], 90))
+        self.assertEqual(state.turns_left, 3 * len(CATEGORIES) - 4)
+        self.assertEqual(state.players[0].filled, 2)
+
+    def test_game_finishes_after_every_category(self) -> None:
+        engine = make_engine()
+        turns = 0
+        finished = False
+        while not finished:
+            engine.state.dice = [2, 2, 3, 3, 3]
+            engine.record_score(CATEGORIES[turns // 2][0])
+            turns += 1
+            finished = engine.advance_turn()
+        self.assertEqual(turns, 2 * len(CATEGORIES))
+        self.assertTrue(all(player.finished for player in engine.state.players))
+        winners, best = engine.winners()
+        self.assertEqual(len(winners), 2)
+        self.assertEqual(best, engine.state.players[0].total)
+
+    def test_restart_resets_progress(self) -> None:
+        engine = make_engine()
+        score_turn(engine, [6, 6, 6, 6, 6], "yacht")
+        engine.state.dice = [1, 2, 3, 4, 5]
+        engine.state.current_player.ability_used = True
+        engine.restart()
+
+        state = engine.state
+        self.assertEqual(state.current_player_index, 0)
+        self.assertEqual(state.turns_left, 2 * len(CATEGORIES))
+        self.assertEqual((state.best_total, state.leaders), (0, {0, 1}))
+        self.assertEqual((state.dice, state.rolls_left), ([0] * DICE_COUNT, ROLLS_PER_TURN))
+        for player in state.players:
+            self.assertEqual((player.scores, player.total, player.filled, player.filled_mask), ({}, 0, 0, 0))
+            self.assertFalse(player.ability_used)
+
+        score_turn(engine, [1, 1, 1, 1, 2], "ones")
+        score_turn(engine, [3, 3, 4, 4, 4], "full_house")
+        self.assertEqual((state.leaders, state.best_total), ({1}, 25))
+        self.assertEqual(state.current_player_index, 0)
+
+    def test_roll_limit(self) -> None:
+        engine = make_engine()
+        for _ in range(ROLLS_PER_TURN):
+            engine.roll()
+        with self.assertRaisesRegex(GameRuleError, "더 이상 굴릴 수 없습니다"):
+            engine.roll()
+
+    def test_record_score_rules(self) -> None:
+        engine = make_engine()
+        with self.assertRaisesRegex(GameRuleError, "먼저 주사위를 굴려주세요"):
+            engine.record_score("chance")
+        engine.state.dice = [1, 2, 3, 4, 5]
+        engine.record_score("chance")
+        with self.assertRaisesRegex(GameRuleError, "이미 기록한 카테고리입니다"):
+            engine.record_score("chance")
+
+    def test_player_abilities_must_match_players(self) -> None:
+        with self.assertRaisesRegex(GameRuleError, "플레이어마다 찬스를 하나씩"):
+            GameState(["가", "나"], "full_reroll", ["swap_dice"])
+
+
+class AbilityTest(unittest.TestCase):
+    def rolled_engine(self, ability_key: str) -> GameEngine:
+        engine = make_engine(ability_key=ability_key)
+        engine.state.dice = [1, 2, 3, 4, 5]
+        return engine
+
+    def assert_rejected(self, engine: GameEngine, message: str, *args) -> None:
+        dice = list(engine.state.dice)
+        with self.assertRaisesRegex(GameRuleError, message):
+            engine.use_ability(*args)
+        self.assertEqual(engine.state.dice, dice)
+        self.assertFalse(engine.state.current_player.ability_used)
+
+    def test_ability_used_once_per_game(self) -> None:
+        engine = self.rolled_engine("full_reroll")
+        engine.use_ability()
+        with self.assertRaisesRegex(GameRuleError, "이미 찬스를 사용했습니다"):
+            engine.use_ability()
+
+    def test_unknown_ability(self) -> None:
+        self.assert_rejected(self.rolled_engine("teleport"), "사용할 수 있는 찬스가 없습니다")
+
+    def test_dice_must_be_rolled_first(self) -> None:
+        for ability_key, args in (
+            ("set_die_to_six", (0,)),
+            ("reroll_selected", ([0],)),
+            ("swap_dice", (0, 1)),
+            ("full_reroll", ()),
+        ):
+            with self.subTest(ability_key=ability_key):
+                self.assert_rejected(make_engine(ability_key=ability_key), "먼저 주사위를 굴려주세요", *args)
+
+    def test_set_die_to_six(self) -> None:
+        for index in (-1, DICE_COUNT):
+            self.assert_rejected(self.rolled_engine("set_die_to_six"), "주사위 위치는 1에서 5 사이입니다", index)
+        engine = self.rolled_engine("set_die_to_six")
+        engine.use_ability(0)
+        self.assertEqual(engine.state.dice, [6, 2, 3, 4, 5])
+
+    def test_reroll_selected(self) -> None:
+        for indices in ([], [0, 1, 2]):
+            self.assert_rejected(self.rolled_engine("reroll_selected"), "최대 2개의 주사위를 선택할 수 있습니다", indices)
+        self.assert_rejected(self.rolled_engine("reroll_selected"), "주사위 위치는 1에서 5 사이입니다", [0, DICE_COUNT])
+        engine = self.rolled_engine("reroll_selected")
+        engine.state.held = [True] * DICE_COUNT
+        engine.use_ability([3, 4])
+        self.assertEqual(engine.state.dice[:3], [1, 2, 3])
+        self.assertEqual(engine.state.held, [True, True, True, False, False])
+
+    def test_swap_dice(self) -> None:
+        self.assert_rejected(self.rolled_engine("swap_dice"), "주사위 위치는 1에서 5 사이입니다", 0, DICE_COUNT)
+        engine = self.rolled_engine("swap_dice")
+        engine.use_ability(0, 4)
+        self.assertEqual(engine.state.dice, [5, 2, 3, 4, 1])
+
+    def test_add_five_points_before_rolling(self) -> None:
+        engine = make_engine(ability_key="add_five_points")
+        engine.use_ability()
+        engine.state.dice = [1, 1, 1, 1, 1]
+        self.assertEqual(engine.record_score("ones"), 5 + RAIN_BONUS)
+        self.assertEqual(engine.state.current_player.pending_bonus, 0)
+
+    def test_full_reroll_clears_holds(self) -> None:
+        engine = self.rolled_engine("full_reroll")
+        engine.state.held = [True] * DICE_COUNT
+        engine.use_ability()
+        self.assertEqual(engine.state.held, [False] * DICE_COUNT)
+        self.assertTrue(all(1 <= value <= 6 for value in engine.state.dice))
+
+    def test_player_specific_ability(self) -> None:
+        engine = make_engine(ability_key="full_reroll", player_abilities=["swap_dice", None])
+        engine.state.dice = [1, 2, 3, 4, 5]
+        self.assert_rejected(engine, "주사위 위치는 1에서 5 사이입니다", 0, DICE_COUNT)
+        score_turn(engine, [1, 2, 3, 4, 5], "chance")
+        self.assertEqual(engine.state.current_ability_key, "full_reroll")
+
+
+if __name__ == "__main__":
+    unittest.main()
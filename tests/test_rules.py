@@ -0,0 +1,71 @@
+import itertools
+import unittest
+from collections import Counter
+
+from yacht_rules import CATEGORIES, ZERO_SCORES, calculate_score, score_all
+
+
+def reference_score(category: str, dice: list[int]) -> int:
+    counts = Counter(dice)
+    total = sum(dice)
+    if category == "ones":
+        return dice.count(1)
+    if category == "twos":
+        return 2 * dice.count(2)
+    if category == "threes":
+        return 3 * dice.count(3)
+    if category == "fours":
+        return 4 * dice.count(4)
+    if category == "fives":
+        return 5 * dice.count(5)
+    if category == "sixes":
+        return 6 * dice.count(6)
+    if category == "four_kind":
+        for value, count in counts.items():
+            if count >= 4:
+                return total
+        return 0
+    if category == "full_house":
+        if sorted(counts.values()) == [2, 3]:
+            return 25
+        return 0
+    if category == "small_straight":
+        unique = sorted(set(dice))
+        straights = [{1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 5, 6}]
+        for straight in straights:
+            if straight.issubset(unique):
+                return 30
+        return 0
+    if category == "large_straight":
+        if set(dice) in ({1, 2, 3, 4, 5}, {2, 3, 4, 5, 6}):
+            return 40
+        return 0
+    if category == "yacht":
+        if len(counts) == 1:
+            return 50
+        return 0
+    if category == "chance":
+        return total
+    return 0
+
+
+class ScoreTableTest(unittest.TestCase):
+    def test_matches_reference_on_all_rolls(self) -> None:
+        for roll in itertools.product(range(1, 7), repeat=5):
+            dice = list(roll)
+            expected = tuple(reference_score(code, dice) for code, _ in CATEGORIES)
+            self.assertEqual(score_all(dice), expected, dice)
+            for index, (code, _) in enumerate(CATEGORIES):
+                self.assertEqual(calculate_score(code, dice), expected[index], dice)
+
+    def test_unrolled_and_invalid_dice_score_zero(self) -> None:
+        self.assertEqual(score_all([0] * 5), ZERO_SCORES)
+        self.assertEqual(score_all([1, 2, 3, 4]), ZERO_SCORES)
+        self.assertEqual(score_all([1, 2, 3, 4, 7]), ZERO_SCORES)
+
+    def test_unknown_category_scores_zero(self) -> None:
+        self.assertEqual(calculate_score("pair", [1, 1, 2, 3, 4]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
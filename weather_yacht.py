@@ -1,123 +1,555 @@
+import functools
 import importlib
+import json
+import os
+import queue
 import random
-import subprocess
+import sqlite3
 import sys
+import threading
+import time
 import tkinter as tk
-from collections import Counter
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future
+from pathlib import Path
 from tkinter import messagebox, simpledialog
 from urllib.parse import quote
 
 import tkinter.ttk as ttk
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
-
-CATEGORIES = [
-    ("ones", "1의 합"),
-    ("twos", "2의 합"),
-    ("threes", "3의 합"),
-    ("fours", "4의 합"),
-    ("fives", "5의 합"),
-    ("sixes", "6의 합"),
-    ("four_kind", "포카드"),
-    ("full_house", "풀하우스"),
-    ("small_straight", "스몰 스트레이트"),
-    ("large_straight", "라지 스트레이트"),
-    ("yacht", "야추"),
-    ("chance", "찬스"),
-]
-CATEGORY_DISPLAY_MAP = {code: display for code, display in CATEGORIES}
-
-WEATHER_THEMES = {
-    "sunny": {
-        "bg": "#ffe27a",
-        "fg": "#2c2100",
-        "ability_name": "햇살 찬스",
-        "ability_desc": "이번 턴에 원하는 주사위 하나를 6으로 바꿀 수 있습니다.",
-        "ability_key": "set_die_to_six",
-    },
-    "cloudy": {
-        "bg": "#d6e4f0",
-        "fg": "#1f2a44",
-        "ability_name": "바람 찬스",
-        "ability_desc": "선택한 주사위 두 개까지 다시 굴립니다.",
-        "ability_key": "reroll_selected",
-    },
-    "rain": {
-        "bg": "#9ec5f8",
-        "fg": "#132d4b",
-        "ability_name": "빗방울 찬스",
-        "ability_desc": "이번 점수에 +5점을 추가합니다.",
-        "ability_key": "add_five_points",
-    },
-    "snow": {
-        "bg": "#f3f8ff",
-        "fg": "#2a2f36",
-        "ability_name": "눈꽃 찬스",
-        "ability_desc": "선택한 주사위 두 개의 값을 서로 바꿉니다.",
-        "ability_key": "swap_dice",
-    },
-    "storm": {
-        "bg": "#494166",
-        "fg": "#f1f1f1",
-        "ability_name": "번개 찬스",
-        "ability_desc": "주사위 전체를 한 번 더 굴립니다 (굴림 횟수 무시).",
-        "ability_key": "full_reroll",
-    },
-}
-
-API_TEST_URL = (
-    "https://api.open-meteo.com/v1/forecast?"
-    "latitude=0&longitude=0&current=temperature_2m"
+from yacht_cities import CityIndex, normalize_city
+from yacht_engine import GameEngine, GameRuleError, PlayerState
+from yacht_paths import user_data_dir
+from yacht_rules import (
+    CATEGORIES,
+    CATEGORY_DISPLAY_MAP,
+    CATEGORY_INDEX,
+    WEATHER_THEMES,
+    ZERO_SCORES,
+    classify_weather,
+    score_all,
 )
 
+requests = None
+
+
 IP_GEOLOCATION_URL = (
     "http://ip-api.com/json/?fields=status,message,city,lat,lon"
 )
 
-if requests is not None:
-    from requests.exceptions import RequestException
-else:
-    RequestException = Exception
 
+def load_requests():
+    global requests
+    if requests is None:
+        try:
+            requests = importlib.import_module("requests")
+        except ImportError:
+            return None
+    return requests
+
+
+BACKGROUND_POLL_MS = 50
+LOADING_DELAY_MS = 150
+LOCATION_PREFETCH_DELAY_MS = 800
+PREFETCH_WAIT_SECONDS = 5
+CITY_SUGGESTION_ROWS = 6
+REFRESH_DEBUG_ENV = "WEATHER_YACHT_DEBUG_REFRESH"
+STARTUP_DEBUG_ENV = "WEATHER_YACHT_DEBUG_STARTUP"
+PROFILE_ENV = "WEATHER_YACHT_PROFILE"
+PROFILE_FILE_NAME = "profile.json"
+PROFILE_OVERLAY_REFRESH_MS = 500
+MAX_PLAYERS = 99
+GRID_MAX_PLAYERS = 4
+RESULT_DETAIL_LIMIT = 10
+RETHEME_OPTIONS = (
+    ("bg", "bg"),
+    ("fg", "fg"),
+    ("activebackground", "bg"),
+    ("activeforeground", "fg"),
+    ("selectcolor", "bg"),
+)
+REFRESH_ORDER = ("player", "rolls", "dice", "categories", "ability")
+
+CACHE_DB_NAME = "cache.sqlite3"
+WEATHER_CACHE_TTL_SECONDS = 15 * 60
+WEATHER_CACHE_MAX_ENTRIES = 32
+WEATHER_CACHE_STALE_SECONDS = 7 * 24 * 60 * 60
+WEATHER_CACHE_PRECISION = 2
+HOURLY_FORECAST_HOURS = 24
+HOURLY_SWITCH_GRACE_MS = 1000
+
+HTTP_TIMEOUT = (3.05, 10)
+HTTP_POOL_SIZE = 4
+HTTP_RETRY_TOTAL = 2
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_JITTER = 0.2
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@contextmanager
+def open_cache_db(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    try:
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                "query TEXT PRIMARY KEY, latitude REAL NOT NULL, "
+                "longitude REAL NOT NULL, name TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS weather ("
+                "key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            yield conn
+    finally:
+        conn.close()
+
+
+class GeocodeCache:
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[float, float, str]] = {}
+        self._transient: dict[str, tuple[float, float, str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(city: str) -> str:
+        return normalize_city(city)
+
+    def _lookup(self, key: str) -> tuple[float, float, str] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                self._entries[key] = entry
+        if entry is None:
+            entry = self._transient.get(key)
+        return entry
+
+    def _read(self, key: str) -> tuple[float, float, str] | None:
+        if self.path is None:
+            return None
+        try:
+            with open_cache_db(self.path) as conn:
+                row = conn.execute(
+                    "SELECT latitude, longitude, name FROM geocode WHERE query = ?",
+                    (key,),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            self.path = None
+            return None
+        return tuple(row) if row else None
+
+    def get(self, city: str) -> tuple[float, float, str] | None:
+        key = self.normalize(city)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
 
-def ensure_requests(root: tk.Tk | None = None, show_success: bool = True) -> bool:
-    global requests, RequestException
-    if requests is not None:
-        return True
+    def _write(self, key: str, entry: tuple[float, float, str]) -> None:
+        self._transient.pop(key, None)
+        self._entries[key] = entry
+        if self.path is None:
+            return
+        try:
+            with open_cache_db(self.path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)",
+                    (key, *entry),
+                )
+        except (sqlite3.Error, OSError):
+            self.path = None
+
+    def put(self, city: str, latitude: float, longitude: float, name: str, persist: bool = True) -> None:
+        key = self.normalize(city)
+        entry = (latitude, longitude, name)
+        with self._lock:
+            if persist:
+                self._write(key, entry)
+            elif key not in self._entries:
+                self._transient[key] = entry
+
+    def promote(self, city: str) -> tuple[float, float, str] | None:
+        key = self.normalize(city)
+        with self._lock:
+            entry = self._transient.get(key)
+            if entry is not None:
+                self._write(key, entry)
+            return entry
+
+    def peek(self, city: str) -> tuple[float, float, str] | None:
+        key = self.normalize(city)
+        with self._lock:
+            return self._lookup(key)
+
+    def entries(self) -> list[tuple[str, float, float, str]]:
+        with self._lock:
+            rows = dict(self._entries)
+            if self.path is not None:
+                try:
+                    with open_cache_db(self.path) as conn:
+                        for query, latitude, longitude, name in conn.execute(
+                            "SELECT query, latitude, longitude, name FROM geocode"
+                        ):
+                            rows.setdefault(query, (latitude, longitude, name))
+                except (sqlite3.Error, OSError):
+                    self.path = None
+        return [(query, *entry) for query, entry in rows.items()]
 
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
-        requests = importlib.import_module("requests")
-        RequestException = requests.exceptions.RequestException
-        if show_success and root is not None:
-            try:
-                messagebox.showinfo(
-                    "라이브러리 설치 완료",
-                    "'requests' 라이브러리가 자동으로 설치되었습니다.",
-                    parent=root,
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class WeatherCache:
+    def __init__(
+        self,
+        path: Path | None,
+        ttl: float = WEATHER_CACHE_TTL_SECONDS,
+        max_entries: int = WEATHER_CACHE_MAX_ENTRIES,
+        stale_ttl: float = WEATHER_CACHE_STALE_SECONDS,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(latitude: float, longitude: float) -> str:
+        return f"{latitude:.{WEATHER_CACHE_PRECISION}f},{longitude:.{WEATHER_CACHE_PRECISION}f}"
+
+    def _read(self, key: str, now: float) -> tuple[float, dict] | None:
+        if self.path is None:
+            return None
+        try:
+            with open_cache_db(self.path) as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, payload FROM weather WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE weather SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, OSError, ValueError):
+            self.path = None
+            return None
+
+    def _write(self, key: str, fetched_at: float, weather: dict) -> None:
+        if self.path is None:
+            return
+        try:
+            with open_cache_db(self.path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO weather VALUES (?, ?, ?, ?)",
+                    (key, fetched_at, fetched_at, json.dumps(weather)),
                 )
-            except Exception:
-                pass
+                conn.execute(
+                    "DELETE FROM weather WHERE fetched_at < ? OR key NOT IN "
+                    "(SELECT key FROM weather ORDER BY accessed_at DESC LIMIT ?)",
+                    (fetched_at - self.stale_ttl, self.max_entries),
+                )
+        except (sqlite3.Error, OSError):
+            self.path = None
+
+    def _remember(self, key: str, entry: tuple[float, dict]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, latitude: float, longitude: float) -> dict | None:
+        key = self.make_key(latitude, longitude)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key) or self._read(key, now)
+            if entry is None:
+                return None
+            if now - entry[0] > self.ttl:
+                return None
+            self._remember(key, entry)
+            return dict(entry[1])
+
+    def get_stale(self, latitude: float, longitude: float) -> dict | None:
+        key = self.make_key(latitude, longitude)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key) or self._read(key, now)
+            if entry is None:
+                return None
+            if now - entry[0] > self.stale_ttl:
+                self._entries.pop(key, None)
+                return None
+            self._remember(key, entry)
+            return {**entry[1], "fetched_at": entry[0]}
+
+    def put(self, latitude: float, longitude: float, weather: dict) -> None:
+        key = self.make_key(latitude, longitude)
+        fetched_at = time.time()
+        with self._lock:
+            self._remember(key, (fetched_at, dict(weather)))
+            self._write(key, fetched_at, weather)
+
+
+class HttpError(Exception):
+    def __init__(self, message: str, response=None) -> None:
+        super().__init__(message)
+        self.response = response
+
+
+class UrllibResponse:
+    def __init__(self, url: str, status_code: int, body: bytes) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HttpError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class UrllibSession:
+    def get(self, url: str, timeout=HTTP_TIMEOUT) -> UrllibResponse:
+        import urllib.error
+        import urllib.request
+
+        seconds = max(timeout) if isinstance(timeout, tuple) else timeout
+        for attempt in range(HTTP_RETRY_TOTAL + 1):
+            try:
+                with urllib.request.urlopen(url, timeout=seconds) as resp:
+                    return UrllibResponse(url, resp.status, resp.read())
+            except urllib.error.HTTPError as exc:
+                response = UrllibResponse(url, exc.code, exc.read())
+                if exc.code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRY_TOTAL:
+                    return response
+            except OSError as exc:
+                if attempt == HTTP_RETRY_TOTAL:
+                    raise HttpError(str(exc)) from exc
+            time.sleep(HTTP_RETRY_BACKOFF * (2**attempt) + random.uniform(0, HTTP_RETRY_JITTER))
+        raise HttpError(f"요청에 실패했습니다: {url}")
+
+    def close(self) -> None:
+        pass
+
+
+def create_http_session():
+    if load_requests() is None:
+        return UrllibSession()
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        backoff_jitter=HTTP_RETRY_JITTER,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def request_ip_location(session) -> dict:
+    response = session.get(IP_GEOLOCATION_URL, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+
+    if data.get("status") != "success":
+        raise ValueError(data.get("message") or "위치 정보를 가져오지 못했습니다.")
+
+    city = data.get("city")
+    latitude = data.get("lat")
+    longitude = data.get("lon")
+
+    if not city or latitude is None or longitude is None:
+        raise ValueError("필수 위치 정보가 누락되었습니다.")
+
+    return {
+        "city": city,
+        "lat": latitude,
+        "lon": longitude,
+    }
+
+
+def open_strategy_table(ability_key: str, build: bool = False):
+    solver = importlib.import_module("yacht_solver")
+    if solver.np is None:
+        raise RuntimeError("최적 수 힌트를 사용하려면 numpy가 필요합니다.")
+    directory = solver.strategy_dir(user_data_dir())
+    if build:
+        return solver.load_or_solve(ability_key, directory)
+    return solver.load_strategy(ability_key, directory)
+
+
+class ApiConnectionError(Exception):
+    pass
+
+
+def is_request_error(exc: Exception) -> bool:
+    if isinstance(exc, HttpError):
         return True
-    except subprocess.CalledProcessError as exc:
-        error_text = f"requests 설치 중 오류가 발생했습니다.\n\n{exc}"
-    except Exception as exc:
-        error_text = f"requests 설치 중 예기치 못한 오류가 발생했습니다.\n\n{exc}"
-    else:
-        error_text = None
-
-    if root is not None:
-        try:
-            messagebox.showerror("라이브러리 설치 실패", error_text or "알 수 없는 오류입니다.", parent=root)
-        except Exception:
-            pass
-    else:
-        print(error_text or "알 수 없는 오류입니다.", file=sys.stderr)
-    return False
+    return requests is not None and isinstance(exc, requests.RequestException)
+
+
+def is_connection_failure(exc: Exception) -> bool:
+    response = getattr(exc, "response", None)
+    return response is None or response.status_code >= 500
+
+
+class DaemonExecutor:
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker") -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((future, func, args, kwargs))
+            if self._idle == 0 and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._idle = max(0, self._idle - 1)
+        return future
+
+    def map(self, func, items):
+        futures = [self.submit(func, item) for item in items]
+        return (future.result() for future in futures)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                self._idle += 1
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> "DaemonExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown(wait=True)
+
+
+class BackgroundTask:
+    def __init__(self, future: Future, on_success, on_error=None, on_cancel=None) -> None:
+        self.future = future
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.loading: tk.Toplevel | None = None
+        self.active = True
+
+    def cancel(self) -> None:
+        self.active = False
+        self.future.cancel()
+
+
+class PhaseProfiler:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.samples: dict[str, list[float]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self.lock:
+            self.samples.setdefault(phase, []).append(seconds)
+
+    def summary(self) -> dict[str, dict]:
+        with self.lock:
+            samples = {phase: list(values) for phase, values in self.samples.items()}
+        return {
+            phase: {
+                "count": len(values),
+                "total_ms": round(sum(values) * 1000, 3),
+                "mean_ms": round(sum(values) / len(values) * 1000, 3),
+                "max_ms": round(max(values) * 1000, 3),
+                "last_ms": round(values[-1] * 1000, 3),
+            }
+            for phase, values in sorted(samples.items())
+        }
+
+    def dump(self, path: Path, extra: dict | None = None) -> None:
+        payload = {"phases": self.summary(), **(extra or {})}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def profiled(phase: str):
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.record(phase, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorate
 
 
 class DiceView(tk.Canvas):
@@ -137,6 +569,8 @@ class DiceView(tk.Canvas):
         ],
     }
 
+    PIP_SLOTS = sorted({position for positions in PIP_POSITIONS.values() for position in positions})
+
     def __init__(self, master, index: int, command, size: int = 100) -> None:
         super().__init__(
             master,
@@ -148,111 +582,68 @@ class DiceView(tk.Canvas):
         self.index = index
         self.command = command
         self.size = size
+        self.rendered: tuple[int, bool, str] | None = None
+        self.visible_pips: set[tuple[float, float]] = set()
+        self.create_items()
         self.bind("<Button-1>", self.on_click)
 
-    def on_click(self, _event) -> None:
-        if self.command:
-            self.command(self.index)
-
-    def render(self, value: int, held: bool, theme_fg: str) -> None:
-        self.delete("all")
+    def create_items(self) -> None:
         size = self.size
         pad = size * 0.08
-        outline_color = "#d43f3f" if held else "#202020"
-        outline_width = 4 if held else 2
-        die_fill = "#fafafa" if not held else "#ffe5b4"
-
-        self.create_rectangle(
-            pad,
-            pad,
-            size - pad,
-            size - pad,
-            fill=die_fill,
-            outline=outline_color,
-            width=outline_width,
+        self.body = self.create_rectangle(pad, pad, size - pad, size - pad)
+        self.placeholder = self.create_text(
+            size / 2,
+            size / 2,
+            text="?",
+            font=("Helvetica", int(size * 0.38), "bold"),
         )
 
-        if value == 0:
-            self.create_text(
-                size / 2,
-                size / 2,
-                text="?",
-                font=("Helvetica", int(size * 0.38), "bold"),
-                fill=theme_fg,
-            )
-            return
-
         radius = size * 0.07
         pip_fill = "#1f1f1f"
-        for x_frac, y_frac in self.PIP_POSITIONS.get(value, []):
+        self.pips: dict[tuple[float, float], int] = {}
+        for x_frac, y_frac in self.PIP_SLOTS:
             x = pad + (size - 2 * pad) * x_frac
             y = pad + (size - 2 * pad) * y_frac
-            self.create_oval(
+            self.pips[(x_frac, y_frac)] = self.create_oval(
                 x - radius,
                 y - radius,
                 x + radius,
                 y + radius,
                 fill=pip_fill,
                 outline=pip_fill,
+                state="hidden",
             )
 
+    def on_click(self, _event) -> None:
+        if self.command:
+            self.command(self.index)
+
+    def render(self, value: int, held: bool, theme_fg: str) -> None:
+        rendered = (value, held, theme_fg)
+        previous = self.rendered
+        if rendered == previous:
+            return
+        self.rendered = rendered
+
+        if previous is None or previous[1] != held:
+            self.itemconfigure(
+                self.body,
+                fill="#ffe5b4" if held else "#fafafa",
+                outline="#d43f3f" if held else "#202020",
+                width=4 if held else 2,
+            )
 
-def classify_weather(code: int) -> str:
-    if code in {0}:
-        return "sunny"
-    if code in {1, 2, 3, 45, 48}:
-        return "cloudy"
-    if code in {51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82}:
-        return "rain"
-    if code in {71, 73, 75, 77, 85, 86}:
-        return "snow"
-    if code in {95, 96, 99}:
-        return "storm"
-    return "cloudy"
-
-
-def calculate_score(category: str, dice: list[int]) -> int:
-    counts = Counter(dice)
-    total = sum(dice)
-    if category == "ones":
-        return dice.count(1)
-    if category == "twos":
-        return 2 * dice.count(2)
-    if category == "threes":
-        return 3 * dice.count(3)
-    if category == "fours":
-        return 4 * dice.count(4)
-    if category == "fives":
-        return 5 * dice.count(5)
-    if category == "sixes":
-        return 6 * dice.count(6)
-    if category == "four_kind":
-        for value, count in counts.items():
-            if count >= 4:
-                return total
-        return 0
-    if category == "full_house":
-        if sorted(counts.values()) == [2, 3]:
-            return 25
-        return 0
-    if category == "small_straight":
-        unique = sorted(set(dice))
-        straights = [{1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 5, 6}]
-        for straight in straights:
-            if straight.issubset(unique):
-                return 30
-        return 0
-    if category == "large_straight":
-        if set(dice) in ({1, 2, 3, 4, 5}, {2, 3, 4, 5, 6}):
-            return 40
-        return 0
-    if category == "yacht":
-        if len(counts) == 1:
-            return 50
-        return 0
-    if category == "chance":
-        return total
-    return 0
+        if previous is None or previous[2] != theme_fg:
+            self.itemconfigure(self.placeholder, fill=theme_fg)
+
+        if previous is None or previous[0] != value:
+            self.itemconfigure(self.placeholder, state="normal" if value == 0 else "hidden")
+            visible = set(self.PIP_POSITIONS.get(value, []))
+            for position in self.visible_pips - visible:
+                self.itemconfigure(self.pips[position], state="hidden")
+            for position in visible - self.visible_pips:
+                self.itemconfigure(self.pips[position], state="normal")
+            self.visible_pips = visible
 
 
 class WeatherYachtApp:
@@ -269,11 +660,28 @@ class WeatherYachtApp:
         self.root.bind("<Escape>", self.exit_fullscreen)
         self.root.bind("<MouseWheel>", self.handle_mousewheel)
         self.root.bind("<Shift-MouseWheel>", self.handle_shift_mousewheel)
+        self.root.bind("<Control-Shift-KeyPress-P>", self.toggle_profile_overlay)
+
+        profile_setting = os.environ.get(PROFILE_ENV, "")
+        self.profiler = PhaseProfiler(enabled=bool(profile_setting))
+        self.profile_path = (
+            Path(profile_setting)
+            if profile_setting and profile_setting.lower() not in {"1", "true", "yes", "on"}
+            else user_data_dir() / PROFILE_FILE_NAME
+        )
+        self.profile_overlay: tk.Toplevel | None = None
+        self.profile_label: tk.Label | None = None
+        self._prepare_started: float | None = None
 
         self.frames: dict[str, tk.Frame] = {}
-        self.players: list[dict] = []
+        self.built_frames: set[str] = set()
+        self.engine = GameEngine()
         self.player_name_vars: list[tk.StringVar] = []
+        self.player_city_vars: list[tk.StringVar] = []
         self.player_entries: list[tk.Entry] = []
+        self.names_text: tk.Text | None = None
+        self.player_entry_cities = False
+        self.player_weather: list[dict] | None = None
 
         self.current_theme = WEATHER_THEMES["cloudy"]
         self.weather_context = {
@@ -283,37 +691,72 @@ class WeatherYachtApp:
             "condition_key": "cloudy",
             "latitude": None,
             "longitude": None,
+            "stale": False,
+            "fetched_at": None,
+            "hourly": None,
         }
 
-        self.dice: list[int] = [0] * 5
-        self.held: list[bool] = [False] * 5
-        self.rolls_left = 3
-        self.current_player_index = 0
+        self.player_header_labels: list[tk.Label] = []
+        self.score_tree_active = False
         self.score_labels: dict[str, list[tk.Label]] = {}
         self.total_labels: list[tk.Label] = []
 
+        self.dirty_parts: set[str] = set()
+        self.refresh_pending = False
+        self.refresh_debug = bool(os.environ.get(REFRESH_DEBUG_ENV))
+        self.refresh_stats = {"flushes": 0, "config_calls": 0, "last_config_calls": 0}
+        self.widget_options: dict[tk.Misc, dict] = {}
+
         self.status_var = tk.StringVar()
         self.weather_info_var = tk.StringVar()
 
         self.player_count_var = tk.IntVar(value=2)
         self.location_var = tk.StringVar(value="Seoul")
+        self.hourly_mode_var = tk.BooleanVar(value=False)
+        self.player_cities_var = tk.BooleanVar(value=False)
         self.detected_location: dict | None = None
-        self._auto_detection_in_progress = False
         self._auto_detection_scheduled = False
 
+        self.executor = DaemonExecutor(max_workers=2, thread_name_prefix="weather-yacht")
+        self.geocode_cache = GeocodeCache(user_data_dir() / CACHE_DB_NAME)
+        self.weather_cache = WeatherCache(user_data_dir() / CACHE_DB_NAME)
+        self.city_index = CityIndex(self.geocode_cache.entries)
+        self.city_suggestions: tk.Listbox | None = None
+        self.city_suggestion_values: list[str] = []
+        self._http_session = None
+        self._http_session_lock = threading.Lock()
+        self._location_task: BackgroundTask | None = None
+        self._weather_task: BackgroundTask | None = None
+        self._revalidate_task: BackgroundTask | None = None
+        self._strategy_task: BackgroundTask | None = None
+        self.strategy_tables: dict[str, object] = {}
+        self._prefetch_after_id: str | None = None
+        self._prefetch_futures: dict[str, Future] = {}
+        self._hourly_after_id: str | None = None
+        self.location_var.trace_add("write", self.on_location_edited)
+
+        self.startup_seconds: float | None = None
         self.create_frames()
         self.show_frame("start")
         self.schedule_auto_location_detection()
         self.set_fullscreen(True)
 
+    @property
+    def players(self) -> list[PlayerState]:
+        return self.engine.state.players
+
+    @profiled("create_frames")
     def create_frames(self) -> None:
         self.frames["start"] = tk.Frame(self.root, bg=self.current_theme["bg"])
         self.frames["setup"] = tk.Frame(self.root, bg=self.current_theme["bg"])
         self.frames["game"] = tk.Frame(self.root, bg=self.current_theme["bg"])
 
-        self.build_start_frame()
-        self.build_setup_frame()
-        self.build_game_frame()
+    def ensure_frame(self, name: str) -> tk.Frame:
+        if name not in self.built_frames:
+            self.frames[name].configure(bg=self.current_theme["bg"])
+            getattr(self, f"build_{name}_frame")()
+            self.built_frames.add(name)
+        return self.frames[name]
 
     def get_fullscreen_button_label(self) -> str:
         return "전체화면 해제 (Esc)" if self.is_fullscreen else "전체화면 실행 (F11)"
@@ -355,57 +798,267 @@ class WeatherYachtApp:
         self.root.after(400, lambda: self.auto_detect_location(silent=True))
 
     def auto_detect_location(self, *, silent: bool) -> None:
-        if requests is None or self._auto_detection_in_progress:
+        if self.is_task_active(self._location_task):
             return
         if silent and self.detected_location is not None:
             return
-        if not ensure_requests(self.root, show_success=False):
+
+        self._location_task = self.run_in_background(
+            lambda: request_ip_location(self.http_session),
+            on_success=lambda location: self.on_location_detected(location, silent=silent),
+            on_error=lambda exc: self.on_location_detection_failed(exc, silent=silent),
+            loading_message=None if silent else "IP 기반으로 현재 위치를 확인하는 중입니다...",
+        )
+
+    def on_location_detected(self, location: dict, *, silent: bool) -> None:
+        city = location["city"]
+        self.detected_location = location
+        self.location_var.set(city)
+        self.prefetch_weather()
+        self.status_var.set(f"자동 감지된 위치: {city}")
+
+        if not silent:
+            try:
+                messagebox.showinfo("위치 자동 감지", f"현재 위치를 {city}로 설정했습니다.")
+            except Exception:
+                pass
+
+    def on_location_detection_failed(self, exc: Exception, *, silent: bool) -> None:
+        if not silent:
+            try:
+                messagebox.showwarning("위치 자동 감지 실패", f"현재 위치를 확인하지 못했습니다.\n\n사유: {exc}")
+            except Exception:
+                pass
+
+    def detected_coordinates(self, city: str) -> tuple[float | None, float | None]:
+        if self.detected_location:
+            detected_city = self.detected_location.get("city")
+            if isinstance(detected_city, str) and detected_city.casefold() == city.casefold():
+                return self.detected_location.get("lat"), self.detected_location.get("lon")
+        return None, None
+
+    def known_coordinates(self, city: str) -> tuple[float | None, float | None]:
+        latitude, longitude = self.detected_coordinates(city)
+        if latitude is not None and longitude is not None:
+            return latitude, longitude
+        local = self.city_index.lookup(city)
+        if local is None:
+            return None, None
+        return local
+
+    def on_location_edited(self, *_args) -> None:
+        self.update_city_suggestions()
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.root.after(LOCATION_PREFETCH_DELAY_MS, self.prefetch_weather)
+
+    @profiled("city_suggest")
+    def update_city_suggestions(self) -> None:
+        listbox = self.city_suggestions
+        if listbox is None:
+            return
+        text = normalize_city(self.location_var.get())
+        suggestions = self.city_index.suggest(text)
+        if any(normalize_city(value) == text for value, *_ in suggestions):
+            suggestions = []
+        self.city_suggestion_values = [value for value, *_ in suggestions]
+        listbox.delete(0, "end")
+        if not suggestions:
+            listbox.grid_remove()
+            return
+        listbox.insert("end", *(label for _, label, _, _ in suggestions))
+        listbox.configure(height=min(CITY_SUGGESTION_ROWS, len(suggestions)))
+        listbox.grid()
+
+    def hide_city_suggestions(self) -> None:
+        if self.city_suggestions is not None:
+            self.city_suggestions.grid_remove()
+
+    def focus_city_suggestions(self, event=None) -> str | None:
+        listbox = self.city_suggestions
+        if listbox is None or not self.city_suggestion_values:
+            return None
+        listbox.focus_set()
+        listbox.selection_clear(0, "end")
+        listbox.selection_set(0)
+        listbox.activate(0)
+        return "break"
+
+    def choose_city_suggestion(self, event=None) -> None:
+        selection = self.city_suggestions.curselection()
+        if not selection:
+            return
+        self.location_var.set(self.city_suggestion_values[selection[0]])
+        self.hide_city_suggestions()
+
+    def prefetch_weather(self) -> None:
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+            self._prefetch_after_id = None
+        city = self.location_var.get().strip()
+        if len(city) < 2:
+            return
+        key = GeocodeCache.normalize(city)
+        pending = self._prefetch_futures.get(key)
+        if pending is not None and not pending.done():
             return
 
-        self._auto_detection_in_progress = True
-        loading: tk.Toplevel | None = None
+        latitude, longitude = self.known_coordinates(city)
+        futures = {name: future for name, future in self._prefetch_futures.items() if not future.done()}
         try:
-            if not silent:
-                loading = self.show_loading("IP 기반으로 현재 위치를 확인하는 중입니다...")
-            self.root.update_idletasks()
+            futures[key] = self.executor.submit(self.fetch_weather, city, latitude, longitude, False)
+        except RuntimeError:
+            return
+        self._prefetch_futures = futures
 
-            response = requests.get(IP_GEOLOCATION_URL, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+    def wait_for_prefetch(self, city: str) -> bool:
+        pending = self._prefetch_futures.get(GeocodeCache.normalize(city))
+        if pending is None:
+            return False
+        try:
+            pending.result(timeout=PREFETCH_WAIT_SECONDS)
+        except Exception:
+            pass
+        return True
 
-            if data.get("status") != "success":
-                raise ValueError(data.get("message") or "위치 정보를 가져오지 못했습니다.")
+    @property
+    def http_session(self):
+        with self._http_session_lock:
+            if self._http_session is None:
+                self._http_session = create_http_session()
+            return self._http_session
 
-            city = data.get("city")
-            latitude = data.get("lat")
-            longitude = data.get("lon")
+    def is_task_active(self, task: BackgroundTask | None) -> bool:
+        return task is not None and task.active
 
-            if not city or latitude is None or longitude is None:
-                raise ValueError("필수 위치 정보가 누락되었습니다.")
+    def run_in_background(
+        self,
+        func,
+        *args,
+        on_success,
+        on_error=None,
+        on_cancel=None,
+        loading_message: str | None = None,
+    ) -> BackgroundTask:
+        task = BackgroundTask(self.executor.submit(func, *args), on_success, on_error, on_cancel)
+        if loading_message is not None:
+            self.root.after(LOADING_DELAY_MS, self.show_task_loading, task, loading_message)
+        self.root.after(BACKGROUND_POLL_MS, self.poll_background_task, task)
+        return task
+
+    def show_task_loading(self, task: BackgroundTask, message: str) -> None:
+        if not task.active or task.loading is not None:
+            return
+        task.loading = self.show_loading(
+            message,
+            on_cancel=lambda: self.cancel_background_task(task),
+        )
 
-            self.detected_location = {
-                "city": city,
-                "lat": latitude,
-                "lon": longitude,
-            }
-            self.location_var.set(city)
-            self.status_var.set(f"자동 감지된 위치: {city}")
+    def poll_background_task(self, task: BackgroundTask) -> None:
+        if not task.active:
+            return
+        if not task.future.done():
+            self.root.after(BACKGROUND_POLL_MS, self.poll_background_task, task)
+            return
 
-            if not silent:
-                try:
-                    messagebox.showinfo("위치 자동 감지", f"현재 위치를 {city}로 설정했습니다.")
-                except Exception:
-                    pass
+        task.active = False
+        self.hide_loading(task.loading)
+        task.loading = None
+        try:
+            result = task.future.result()
         except Exception as exc:
-            if not silent:
-                try:
-                    messagebox.showwarning("위치 자동 감지 실패", f"현재 위치를 확인하지 못했습니다.\n\n사유: {exc}")
-                except Exception:
-                    pass
-        finally:
-            self.hide_loading(loading)
-            self._auto_detection_in_progress = False
+            if task.on_error is not None:
+                task.on_error(exc)
+            return
+        task.on_success(result)
+
+    def cancel_background_task(self, task: BackgroundTask) -> None:
+        if not task.active:
+            return
+        task.cancel()
+        self.hide_loading(task.loading)
+        task.loading = None
+        if task.on_cancel is not None:
+            task.on_cancel()
+
+    def toggle_profile_overlay(self, event=None) -> None:
+        if self.profile_overlay is not None:
+            self.profile_overlay.destroy()
+            self.profile_overlay = None
+            self.profile_label = None
+            return
+        self.profiler.enabled = True
+        self.show_profile_overlay()
+
+    def show_profile_overlay(self) -> None:
+        if self.profile_overlay is not None:
+            return
+        top = tk.Toplevel(self.root)
+        top.title("성능 측정")
+        top.resizable(False, False)
+        top.attributes("-topmost", True)
+        top.protocol("WM_DELETE_WINDOW", self.toggle_profile_overlay)
+        self.profile_label = tk.Label(
+            top,
+            font=("Courier", 11),
+            justify="left",
+            anchor="nw",
+            bg="#111111",
+            fg="#e8e8e8",
+            padx=10,
+            pady=10,
+        )
+        self.profile_label.pack(fill="both", expand=True)
+        self.profile_overlay = top
+        self.refresh_profile_overlay()
+
+    def profile_report(self) -> str:
+        lines = [f"{'구간 (ms)':<26}{'횟수':>6}{'최근':>10}{'평균':>10}{'최대':>10}"]
+        for phase, stats in self.profiler.summary().items():
+            lines.append(
+                f"{phase:<28}{stats['count']:>6}{stats['last_ms']:>10.2f}"
+                f"{stats['mean_ms']:>10.2f}{stats['max_ms']:>10.2f}"
+            )
+        refresh = self.refresh_stats
+        lines.append("")
+        lines.append(f"화면 갱신 {refresh['flushes']}회, 마지막 갱신의 config {refresh['last_config_calls']}회")
+        geocode = self.geocode_cache.stats()
+        lines.append(f"지오코딩 캐시 hit {geocode['hits']}회, miss {geocode['misses']}회, {geocode['size']}개 저장")
+        if self.startup_seconds is not None:
+            lines.append(f"시작 화면 표시까지 {self.startup_seconds * 1000:.0f}ms")
+        return "\n".join(lines)
+
+    def refresh_profile_overlay(self) -> None:
+        if self.profile_label is None:
+            return
+        self.profile_label.config(text=self.profile_report())
+        self.root.after(PROFILE_OVERLAY_REFRESH_MS, self.refresh_profile_overlay)
 
+    def shutdown(self) -> None:
+        if self.profiler.enabled:
+            startup_ms = None if self.startup_seconds is None else self.startup_seconds * 1000
+            try:
+                self.profiler.dump(
+                    self.profile_path,
+                    {
+                        "startup_ms": startup_ms,
+                        "refresh": self.refresh_stats,
+                        "geocode_cache": self.geocode_cache.stats(),
+                    },
+                )
+            except OSError as exc:
+                print(f"성능 측정 결과를 저장하지 못했습니다: {exc}", file=sys.stderr)
+        self.cancel_hourly_weather()
+        for task in (self._location_task, self._weather_task, self._revalidate_task):
+            if task is not None:
+                task.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        with self._http_session_lock:
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
+    @profiled("build_start_frame")
     def build_start_frame(self) -> None:
         frame = self.frames["start"]
         for widget in frame.winfo_children():
@@ -453,6 +1106,7 @@ class WeatherYachtApp:
             fg=self.current_theme["fg"],
         ).pack(pady=5)
 
+    @profiled("build_setup_frame")
     def build_setup_frame(self) -> None:
         frame = self.frames["setup"]
         for widget in frame.winfo_children():
@@ -471,7 +1125,7 @@ class WeatherYachtApp:
 
         tk.Label(
             selector,
-            text="플레이어 수 (1~4명):",
+            text=f"플레이어 수 (1~{MAX_PLAYERS}명):",
             font=("Helvetica", 16),
             bg=self.current_theme["bg"],
             fg=self.current_theme["fg"],
@@ -480,7 +1134,7 @@ class WeatherYachtApp:
         count_box = tk.Spinbox(
             selector,
             from_=1,
-            to=4,
+            to=MAX_PLAYERS,
             width=5,
             font=("Helvetica", 16),
             textvariable=self.player_count_var,
@@ -496,12 +1150,15 @@ class WeatherYachtApp:
             fg=self.current_theme["fg"],
         ).grid(row=1, column=0, padx=10, pady=5, sticky="e")
 
-        tk.Entry(
+        city_entry = tk.Entry(
             selector,
             textvariable=self.location_var,
             font=("Helvetica", 16),
             width=18,
-        ).grid(row=1, column=1, padx=10, pady=5, sticky="w")
+        )
+        city_entry.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+        city_entry.bind("<Down>", self.focus_city_suggestions)
+        city_entry.bind("<Escape>", lambda event: self.hide_city_suggestions())
 
         tk.Button(
             selector,
@@ -510,6 +1167,44 @@ class WeatherYachtApp:
             command=lambda: self.auto_detect_location(silent=False),
         ).grid(row=1, column=2, padx=10, pady=5, sticky="w")
 
+        self.city_suggestions = tk.Listbox(
+            selector,
+            font=("Helvetica", 14),
+            height=CITY_SUGGESTION_ROWS,
+            activestyle="none",
+            exportselection=False,
+        )
+        self.city_suggestions.grid(row=2, column=1, columnspan=2, padx=10, sticky="ew")
+        self.city_suggestions.grid_remove()
+        self.city_suggestions.bind("<ButtonRelease-1>", self.choose_city_suggestion)
+        self.city_suggestions.bind("<Return>", self.choose_city_suggestion)
+        self.city_suggestions.bind("<Escape>", lambda event: self.hide_city_suggestions())
+
+        tk.Checkbutton(
+            selector,
+            text="시간별 예보 반영 (정각마다 테마와 찬스 변경)",
+            variable=self.hourly_mode_var,
+            font=("Helvetica", 14),
+            bg=self.current_theme["bg"],
+            fg=self.current_theme["fg"],
+            activebackground=self.current_theme["bg"],
+            activeforeground=self.current_theme["fg"],
+            selectcolor=self.current_theme["bg"],
+        ).grid(row=3, column=0, columnspan=3, pady=5, sticky="w")
+
+        tk.Checkbutton(
+            selector,
+            text="플레이어마다 다른 도시 사용 (각자 날씨 찬스)",
+            variable=self.player_cities_var,
+            command=self.update_player_entries,
+            font=("Helvetica", 14),
+            bg=self.current_theme["bg"],
+            fg=self.current_theme["fg"],
+            activebackground=self.current_theme["bg"],
+            activeforeground=self.current_theme["fg"],
+            selectcolor=self.current_theme["bg"],
+        ).grid(row=4, column=0, columnspan=3, pady=5, sticky="w")
+
         self.names_container = tk.Frame(frame, bg=self.current_theme["bg"])
         self.names_container.pack(pady=30)
         self.update_player_entries()
@@ -529,6 +1224,7 @@ class WeatherYachtApp:
             command=lambda: self.show_frame("start"),
         ).pack()
 
+    @profiled("build_game_frame")
     def build_game_frame(self) -> None:
         frame = self.frames["game"]
         for widget in frame.winfo_children():
@@ -599,6 +1295,15 @@ class WeatherYachtApp:
         )
         self.ability_button.grid(row=0, column=2, padx=10)
 
+        self.hint_button = tk.Button(
+            controls,
+            text="최적 수 힌트",
+            font=("Helvetica", 16),
+            width=12,
+            command=self.show_hint,
+        )
+        self.hint_button.grid(row=0, column=3, padx=10)
+
         self.status_label = tk.Label(
             frame,
             textvariable=self.status_var,
@@ -723,20 +1428,108 @@ class WeatherYachtApp:
         self.score_xscrollbar.pack(side="bottom", fill="x")
 
         self.score_frame = self.score_inner
+        self.build_scoreboard_labels()
+
+        self.score_tree_frame = tk.Frame(self.score_container, bg=self.current_theme["bg"])
+        columns = ("name", *(code for code, _ in CATEGORIES), "total")
+        self.score_tree = ttk.Treeview(
+            self.score_tree_frame,
+            columns=columns,
+            show="headings",
+            selectmode="browse",
+        )
+        self.score_tree.heading("name", text="플레이어")
+        self.score_tree.column("name", width=140, anchor="w", stretch=False)
+        for code, display in CATEGORIES:
+            self.score_tree.heading(code, text=display)
+            self.score_tree.column(code, width=90, anchor="center", stretch=False)
+        self.score_tree.heading("total", text="총점")
+        self.score_tree.column("total", width=80, anchor="center", stretch=False)
+        tree_scrollbar = ttk.Scrollbar(
+            self.score_tree_frame,
+            orient="vertical",
+            command=self.score_tree.yview,
+        )
+        tree_xscrollbar = ttk.Scrollbar(
+            self.score_tree_frame,
+            orient="horizontal",
+            command=self.score_tree.xview,
+        )
+        self.score_tree.configure(
+            yscrollcommand=tree_scrollbar.set,
+            xscrollcommand=tree_xscrollbar.set,
+        )
+        self.score_tree.grid(row=0, column=0, sticky="nsew")
+        tree_scrollbar.grid(row=0, column=1, sticky="ns")
+        tree_xscrollbar.grid(row=1, column=0, sticky="ew")
+        self.score_tree_frame.rowconfigure(0, weight=1)
+        self.score_tree_frame.columnconfigure(0, weight=1)
+
+    def entered_player_rows(self) -> list[tuple[str, str]]:
+        if self.names_text is not None:
+            lines = self.names_text.get("1.0", "end-1c").splitlines()
+            if not self.player_entry_cities:
+                return [(line.strip(), "") for line in lines]
+            return [(name.strip(), city.strip()) for name, _, city in (line.partition(",") for line in lines)]
+        cities = [var.get().strip() for var in self.player_city_vars]
+        return [
+            (var.get().strip(), cities[idx] if idx < len(cities) else "")
+            for idx, var in enumerate(self.player_name_vars)
+        ]
 
     def update_player_entries(self) -> None:
-        existing_names = [var.get() for var in self.player_name_vars]
+        existing_rows = self.entered_player_rows()
         for widget in self.names_container.winfo_children():
             widget.destroy()
         self.player_entries.clear()
         self.player_name_vars.clear()
+        self.player_city_vars.clear()
+        self.names_text = None
+        self.player_entry_cities = self.player_cities_var.get()
 
-        count = self.player_count_var.get()
-        for idx in range(count):
-            default_name = f"플레이어 {idx + 1}"
-            initial_value = existing_names[idx] if idx < len(existing_names) else default_name
-            name_text = initial_value or default_name
+        try:
+            count = self.player_count_var.get()
+        except tk.TclError:
+            return
+        names = [
+            (existing_rows[idx][0] if idx < len(existing_rows) else "") or f"플레이어 {idx + 1}"
+            for idx in range(max(0, min(count, MAX_PLAYERS)))
+        ]
+        cities = [existing_rows[idx][1] if idx < len(existing_rows) else "" for idx in range(len(names))]
+
+        if count > GRID_MAX_PLAYERS:
+            if self.player_entry_cities:
+                label_text = "플레이어 이름, 도시 (한 줄에 한 명, 도시를 비우면 위의 도시):"
+                lines = [f"{name}, {city}" if city else name for name, city in zip(names, cities)]
+            else:
+                label_text = "플레이어 이름 (한 줄에 한 명, 비워 두면 기본 이름):"
+                lines = names
+            tk.Label(
+                self.names_container,
+                text=label_text,
+                font=("Helvetica", 14),
+                bg=self.current_theme["bg"],
+                fg=self.current_theme["fg"],
+            ).grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+            self.names_text = tk.Text(
+                self.names_container,
+                font=("Helvetica", 14),
+                width=24,
+                height=10,
+                wrap="none",
+            )
+            self.names_text.insert("1.0", "\n".join(lines))
+            self.names_text.grid(row=1, column=0, padx=(10, 0), pady=5, sticky="nsew")
+            names_scrollbar = tk.Scrollbar(
+                self.names_container,
+                orient="vertical",
+                command=self.names_text.yview,
+            )
+            names_scrollbar.grid(row=1, column=1, pady=5, sticky="ns")
+            self.names_text.configure(yscrollcommand=names_scrollbar.set)
+            return
 
+        for idx, name_text in enumerate(names):
             label = tk.Label(
                 self.names_container,
                 text=f"플레이어 {idx + 1} 이름:",
@@ -757,155 +1550,611 @@ class WeatherYachtApp:
             self.player_entries.append(entry)
             self.player_name_vars.append(var)
 
+            if self.player_entry_cities:
+                city_var = tk.StringVar(value=cities[idx])
+                tk.Entry(
+                    self.names_container,
+                    textvariable=city_var,
+                    font=("Helvetica", 14),
+                    width=14,
+                ).grid(row=idx, column=2, padx=10, pady=5, sticky="w")
+                self.player_city_vars.append(city_var)
+
+    @profiled("prepare_game.dispatch")
     def prepare_game(self) -> None:
-        count = self.player_count_var.get()
-        if count < 1 or count > 4:
-            messagebox.showerror("오류", "플레이어 수는 1명에서 4명 사이여야 합니다.")
+        if self.is_task_active(self._weather_task):
             return
 
-        names = [var.get().strip() or f"플레이어 {idx + 1}" for idx, var in enumerate(self.player_name_vars)]
+        try:
+            count = self.player_count_var.get()
+        except tk.TclError:
+            count = 0
+        if count < 1 or count > MAX_PLAYERS:
+            messagebox.showerror("오류", f"플레이어 수는 1명에서 {MAX_PLAYERS}명 사이여야 합니다.")
+            return
 
-        city = self.location_var.get().strip() or "Seoul"
-        latitude = None
-        longitude = None
-        if self.detected_location:
-            detected_city = self.detected_location.get("city")
-            if isinstance(detected_city, str) and detected_city.casefold() == city.casefold():
-                latitude = self.detected_location.get("lat")
-                longitude = self.detected_location.get("lon")
+        entered = self.entered_player_rows()
+        names = [
+            (entered[idx][0] if idx < len(entered) else "") or f"플레이어 {idx + 1}"
+            for idx in range(count)
+        ]
 
-        loading = self.show_loading("인터넷 연결 확인 및 날씨를 불러오는 중입니다...")
-        self.root.update_idletasks()
+        city = self.location_var.get().strip() or "Seoul"
+        latitude, longitude = self.known_coordinates(city)
+
+        self._prepare_started = time.perf_counter()
+        if self.player_entry_cities:
+            cities = [(entered[idx][1] if idx < len(entered) else "") or city for idx in range(count)]
+            self._weather_task = self.run_in_background(
+                self.load_player_weather,
+                cities,
+                city,
+                latitude,
+                longitude,
+                on_success=lambda weathers: self.on_player_weather(names, cities, weathers),
+                on_error=self.show_weather_error,
+                on_cancel=lambda: self.status_var.set("날씨 불러오기를 취소했습니다."),
+                loading_message="플레이어별 날씨를 불러오는 중입니다...",
+            )
+            return
+        self._weather_task = self.run_in_background(
+            self.load_start_weather,
+            city,
+            latitude,
+            longitude,
+            on_success=lambda result: self.on_start_weather(names, city, *result),
+            on_error=self.show_weather_error,
+            on_cancel=lambda: self.status_var.set("날씨 불러오기를 취소했습니다."),
+            loading_message="날씨를 불러오는 중입니다...",
+        )
 
-        weather = None
+    @profiled("prepare_game.network")
+    def load_start_weather(
+        self,
+        city: str,
+        latitude: float | None = None,
+        longitude: float | None = None,
+    ) -> tuple[dict | None, bool, float | None, float | None]:
+        for waited in (False, True):
+            if waited and not self.wait_for_prefetch(city):
+                break
+            if latitude is None or longitude is None:
+                location = self.geocode_cache.peek(city)
+                if location is not None:
+                    latitude, longitude, _ = location
+            if latitude is not None and longitude is not None:
+                cached = self.cached_weather(latitude, longitude)
+                if cached is not None:
+                    return cached, "fetched_at" in cached, latitude, longitude
+        return self.fetch_weather(city, latitude, longitude), False, latitude, longitude
+
+    def cached_weather(self, latitude: float, longitude: float) -> dict | None:
+        return self.weather_cache.get(latitude, longitude) or self.weather_cache.get_stale(latitude, longitude)
+
+    @profiled("prepare_game.network")
+    def load_player_weather(
+        self,
+        cities: list[str],
+        home_city: str,
+        latitude: float | None = None,
+        longitude: float | None = None,
+    ) -> dict[str, dict | None]:
+        queries = {GeocodeCache.normalize(city): city for city in cities}
+        weathers: dict[str, dict | None] = dict.fromkeys(queries)
         try:
-            if not ensure_requests(self.root, show_success=False):
-                return
-            if not self.verify_api_connection():
-                return
-            weather = self.fetch_weather(city, latitude, longitude)
-        finally:
-            self.hide_loading(loading)
-
-        if weather is None:
+            locations: dict[str, tuple[float, float]] = {}
+            home_key = GeocodeCache.normalize(home_city)
+            if home_key in queries and latitude is not None and longitude is not None:
+                locations[home_key] = (latitude, longitude)
+            missing = [city for key, city in queries.items() if key not in locations]
+            if missing:
+                with DaemonExecutor(
+                    max_workers=min(HTTP_POOL_SIZE, len(missing)),
+                    thread_name_prefix="weather-yacht-geocode",
+                ) as pool:
+                    for city, location in zip(missing, pool.map(self.geocode_city, missing)):
+                        if location is not None:
+                            locations[GeocodeCache.normalize(city)] = location[:2]
+
+            home = locations.get(home_key)
+            if home is not None and self.cached_weather(*home) is None:
+                self.wait_for_prefetch(home_city)
+            pending = []
+            for key, (target_lat, target_lon) in locations.items():
+                cached = self.cached_weather(target_lat, target_lon)
+                if cached is None:
+                    pending.append((key, target_lat, target_lon))
+                else:
+                    weathers[key] = cached
+            if pending:
+                fetched = self.request_weather_batch([(lat, lon) for _, lat, lon in pending])
+                for (key, target_lat, target_lon), weather in zip(pending, fetched):
+                    if weather is not None:
+                        self.weather_cache.put(target_lat, target_lon, weather)
+                    weathers[key] = weather
+        except Exception as exc:
+            if not is_request_error(exc):
+                if isinstance(exc, json.JSONDecodeError):
+                    return weathers
+                raise
+            if is_connection_failure(exc):
+                raise ApiConnectionError(exc) from exc
+        return weathers
+
+    def on_player_weather(self, names: list[str], cities: list[str], weathers: dict[str, dict | None]) -> None:
+        failed = [city for city in dict.fromkeys(cities) if weathers.get(GeocodeCache.normalize(city)) is None]
+        if failed:
             messagebox.showerror(
                 "날씨 정보 오류",
-                "선택한 도시의 날씨를 불러올 수 없습니다.\n인터넷 연결과 입력한 도시 이름을 확인해주세요.",
+                f"다음 도시의 날씨를 불러올 수 없습니다: {', '.join(failed)}\n"
+                "인터넷 연결과 입력한 도시 이름을 확인해주세요.",
             )
             return
+        player_weather = []
+        for city in cities:
+            weather = weathers[GeocodeCache.normalize(city)]
+            context = self.make_weather_context(city, weather)
+            context.update(stale="fetched_at" in weather, fetched_at=weather.get("fetched_at"))
+            player_weather.append(context)
+        self.start_game(names, cities[0], weathers[GeocodeCache.normalize(cities[0])], player_weather=player_weather)
+        stale = [context for context in player_weather if context["stale"]]
+        locations = list(dict.fromkeys((context["latitude"], context["longitude"]) for context in stale))
+        if not locations:
+            return
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+        self._revalidate_task = self.run_in_background(
+            self.revalidate_weather_batch,
+            locations,
+            on_success=lambda fresh: self.on_player_weather_revalidated(player_weather, locations, fresh),
+            on_error=lambda exc: self.on_player_weather_revalidated(player_weather, locations, None),
+        )
+        self.weather_info_var.set(self.describe_weather())
 
-        condition = weather["condition"]
-        temperature = weather["temperature"]
-        code = weather["code"]
+    def revalidate_weather_batch(self, locations: list[tuple[float, float]]) -> list[dict | None]:
+        fetched = self.request_weather_batch(locations)
+        for (latitude, longitude), weather in zip(locations, fetched):
+            if weather is not None:
+                self.weather_cache.put(latitude, longitude, weather)
+        return fetched
 
-        latitude = weather.get("latitude")
-        longitude = weather.get("longitude")
+    def on_player_weather_revalidated(
+        self,
+        player_weather: list[dict],
+        locations: list[tuple[float, float]],
+        fetched: list[dict | None] | None,
+    ) -> None:
+        if not self.players or self.player_weather is not player_weather:
+            return
+        fresh = dict(zip(locations, fetched or []))
+        for context in player_weather:
+            weather = fresh.get((context["latitude"], context["longitude"]))
+            if not context["stale"] or weather is None:
+                continue
+            hourly = weather.get("hourly") if self.hourly_mode_var.get() else None
+            context.update(
+                stale=False,
+                fetched_at=None,
+                hourly=hourly,
+                temperature=weather["temperature"],
+                code=weather["code"],
+                condition_key=classify_weather(weather["code"]),
+            )
+        self.sync_abilities()
+        self.refresh_weather_theme("최신 날씨로 바뀌어")
+        self.schedule_hourly_weather()
 
-        self.weather_context = {
-            "city": city,
-            "temperature": temperature,
-            "code": code,
-            "condition_key": condition,
-            "latitude": latitude,
-            "longitude": longitude,
-        }
-        self.apply_theme(condition)
-
-        self.players = []
-        for name in names:
-            self.players.append(
-                {
-                    "name": name,
-                    "scores": {},
-                    "ability_used": False,
-                    "pending_bonus": 0,
-                }
+    def on_start_weather(
+        self,
+        names: list[str],
+        city: str,
+        weather: dict | None,
+        stale: bool,
+        latitude: float | None,
+        longitude: float | None,
+    ) -> None:
+        self.start_game(names, city, weather, stale=stale)
+        if weather is None:
+            return
+        self.remember_city(city)
+        if not stale:
+            return
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+        self._revalidate_task = self.run_in_background(
+            self.fetch_weather,
+            city,
+            latitude,
+            longitude,
+            on_success=lambda fresh: self.on_weather_revalidated(city, fresh),
+            on_error=lambda exc: self.on_weather_revalidated(city, None),
+        )
+        self.weather_info_var.set(self.describe_weather())
+
+    def remember_city(self, city: str) -> None:
+        location = self.geocode_cache.promote(city)
+        if location is not None:
+            self.city_index.add(*location)
+
+    def on_weather_revalidated(self, city: str, weather: dict | None) -> None:
+        context = self.weather_context
+        if not self.players or context["city"] != city or not context["stale"]:
+            return
+        if weather is None:
+            self.weather_info_var.set(self.describe_weather())
+            return
+
+        hourly = weather.get("hourly") if self.hourly_mode_var.get() else None
+        context.update(stale=False, fetched_at=None, hourly=hourly)
+        self.change_weather(weather["code"], weather["temperature"], "최신 날씨로 바뀌어")
+        self.schedule_hourly_weather()
+
+    def change_weather(self, code: int, temperature: float | None, reason: str) -> None:
+        self.weather_context.update(temperature=temperature, code=code, condition_key=classify_weather(code))
+        self.refresh_weather_theme(reason)
+
+    def refresh_weather_theme(self, reason: str) -> None:
+        condition = self.weather_context["condition_key"]
+        if WEATHER_THEMES.get(condition) is not self.current_theme:
+            self.apply_theme(condition)
+            self.sync_abilities()
+            self.invalidate("dice", "categories", "ability")
+            self.status_var.set(f"{reason} {self.current_theme['ability_name']}가 적용됩니다.")
+            self.preload_strategy()
+        self.weather_info_var.set(self.describe_weather())
+
+    def hourly_forecast(self, hourly: dict | None, now: float) -> tuple[int, float | None] | None:
+        if not hourly:
+            return None
+        slot = int((now - hourly["start"]) // 3600)
+        codes = hourly["codes"]
+        if not 0 <= slot < len(codes):
+            return None
+        temperatures = hourly["temperatures"]
+        return codes[slot], temperatures[slot] if slot < len(temperatures) else None
+
+    def apply_hourly_forecast(self, context: dict, now: float) -> bool:
+        hourly = context.get("hourly")
+        if not hourly or now - hourly["start"] < 3600:
+            return False
+        forecast = self.hourly_forecast(hourly, now)
+        if forecast is None:
+            return False
+        code, temperature = forecast
+        context.update(code=code, temperature=temperature, condition_key=classify_weather(code))
+        return True
+
+    def weather_contexts(self) -> list[dict]:
+        return self.player_weather or [self.weather_context]
+
+    def sync_abilities(self) -> None:
+        if not self.player_weather:
+            self.engine.state.ability_key = WEATHER_THEMES[self.weather_context["condition_key"]]["ability_key"]
+            return
+        for player, context in zip(self.players, self.player_weather):
+            player.ability_key = WEATHER_THEMES[context["condition_key"]]["ability_key"]
+
+    def schedule_hourly_weather(self) -> None:
+        self.cancel_hourly_weather()
+        if not self.hourly_mode_var.get() or not self.players:
+            return
+        now = time.time()
+        boundaries = []
+        for context in self.weather_contexts():
+            hourly = context.get("hourly")
+            if not hourly:
+                continue
+            next_slot = int((now - hourly["start"]) // 3600) + 1
+            if next_slot < len(hourly["codes"]):
+                boundaries.append(hourly["start"] + next_slot * 3600)
+        if not boundaries:
+            return
+        delay = min(boundaries) - now
+        self._hourly_after_id = self.root.after(
+            max(0, int(delay * 1000)) + HOURLY_SWITCH_GRACE_MS,
+            self.apply_hourly_weather,
+        )
+
+    def cancel_hourly_weather(self) -> None:
+        if self._hourly_after_id is not None:
+            self.root.after_cancel(self._hourly_after_id)
+            self._hourly_after_id = None
+
+    def apply_hourly_weather(self) -> None:
+        self._hourly_after_id = None
+        if not self.players:
+            return
+        now = time.time()
+        changed = [self.apply_hourly_forecast(context, now) for context in self.weather_contexts()]
+        if any(changed):
+            self.sync_abilities()
+            self.refresh_weather_theme("예보 시각이 바뀌어")
+        self.schedule_hourly_weather()
+
+    @profiled("prepare_game.ui")
+    def start_game(
+        self,
+        names: list[str],
+        city: str,
+        weather: dict | None,
+        stale: bool = False,
+        player_weather: list[dict] | None = None,
+    ) -> None:
+        if weather is None:
+            messagebox.showerror(
+                "날씨 정보 오류",
+                "선택한 도시의 날씨를 불러올 수 없습니다.\n인터넷 연결과 입력한 도시 이름을 확인해주세요.",
             )
+            return
+
+        self.player_weather = player_weather
+        if player_weather:
+            self.weather_context = player_weather[0]
+        else:
+            self.weather_context = self.make_weather_context(city, weather)
+            self.weather_context.update(stale=stale, fetched_at=weather.get("fetched_at") if stale else None)
+        now = time.time()
+        for context in self.weather_contexts():
+            self.apply_hourly_forecast(context, now)
+        self.apply_theme(self.weather_context["condition_key"])
+        self.ensure_frame("game")
+        player_abilities = None
+        if player_weather:
+            player_abilities = [WEATHER_THEMES[context["condition_key"]]["ability_key"] for context in player_weather]
+        self.engine.new_game(names, self.current_theme["ability_key"], player_abilities)
 
         self.setup_scoreboard()
         self.reset_game_state()
         self.show_frame("game")
         self.start_turn()
+        self.preload_strategy()
+        self.schedule_hourly_weather()
+        if self.profiler.enabled and self._prepare_started is not None:
+            self.profiler.record("prepare_game.total", time.perf_counter() - self._prepare_started)
+            self._prepare_started = None
+
+    def make_weather_context(self, city: str, weather: dict) -> dict:
+        return {
+            "city": city,
+            "temperature": weather["temperature"],
+            "code": weather["code"],
+            "condition_key": weather["condition"],
+            "latitude": weather.get("latitude"),
+            "longitude": weather.get("longitude"),
+            "stale": False,
+            "fetched_at": None,
+            "hourly": weather.get("hourly") if self.hourly_mode_var.get() else None,
+        }
 
-    def verify_api_connection(self) -> bool:
-        if not ensure_requests(self.root, show_success=False):
-            return False
-        try:
-            response = requests.get(API_TEST_URL, timeout=5)
-            response.raise_for_status()
-            return True
-        except RequestException as exc:
-            messagebox.showerror(
-                "인터넷 연결 필요",
-                "Open-Meteo API에 연결할 수 없습니다.\n"
-                "인터넷 상태 또는 SSL 인증서를 확인한 뒤 다시 시도해주세요.\n\n"
-                f"오류: {exc}",
-            )
-            return False
+    def apply_player_weather(self) -> None:
+        if not self.player_weather:
+            return
+        self.weather_context = self.player_weather[self.engine.state.current_player_index]
+        if WEATHER_THEMES.get(self.weather_context["condition_key"]) is not self.current_theme:
+            self.apply_theme(self.weather_context["condition_key"])
+            self.preload_strategy()
+        self.weather_info_var.set(self.describe_weather())
 
+    def preload_strategy(self) -> None:
+        ability_key = self.current_theme["ability_key"]
+        if ability_key in self.strategy_tables or self.is_task_active(self._strategy_task):
+            return
+        self._strategy_task = self.run_in_background(
+            open_strategy_table,
+            ability_key,
+            on_success=lambda table: self.remember_strategy(ability_key, table),
+            on_error=lambda exc: None,
+        )
+
+    def remember_strategy(self, ability_key: str, table) -> None:
+        if table is not None:
+            self.strategy_tables[ability_key] = table
+
+    def show_hint(self) -> None:
+        if not self.players:
+            return
+        if not self.engine.state.dice_rolled:
+            messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
+            return
+        if self.is_task_active(self._strategy_task):
+            messagebox.showinfo("안내", "힌트를 준비하는 중입니다. 잠시 후 다시 시도해주세요.")
+            return
+
+        ability_key = self.current_theme["ability_key"]
+        table = self.strategy_tables.get(ability_key)
+        if table is not None:
+            self.display_hint(table)
+            return
+
+        self._strategy_task = self.run_in_background(
+            open_strategy_table,
+            ability_key,
+            True,
+            on_success=lambda table: self.on_strategy_built(ability_key, table),
+            on_error=self.show_hint_error,
+            loading_message="최적 전략 표를 처음 계산하는 중입니다...",
+        )
+
+    def on_strategy_built(self, ability_key: str, table) -> None:
+        self.remember_strategy(ability_key, table)
+        if self.players and self.engine.state.dice_rolled:
+            self.display_hint(table)
+
+    def display_hint(self, table) -> None:
+        state = self.engine.state
+        player = state.current_player
+        value, action = table.lookup(
+            player.filled_mask,
+            not player.ability_used,
+            state.rolls_left,
+            state.dice,
+        )
+        hint = table.describe_action(action, state.dice)
+        positions = ", ".join(str(idx + 1) for idx in hint.get("positions", []))
+
+        if hint["kind"] == "score":
+            text = f"추천: '{CATEGORY_DISPLAY_MAP[hint['category']]}'에 기록하세요."
+        elif hint["kind"] == "reroll":
+            held = ", ".join(str(idx + 1) for idx, keep in enumerate(hint["held"]) if keep)
+            if held:
+                text = f"추천: {held}번 주사위를 고정하고 다시 굴리세요."
+            else:
+                text = "추천: 모든 주사위를 다시 굴리세요."
+        elif positions:
+            text = f"추천: {self.current_theme['ability_name']}를 사용하세요 (주사위 {positions}번)."
+        else:
+            text = f"추천: {self.current_theme['ability_name']}를 사용하세요."
+
+        expected = player.total + player.pending_bonus + value
+        self.status_var.set(f"{text} 예상 최종 점수 {expected:.1f}점")
+
+    def show_hint_error(self, exc: Exception) -> None:
+        messagebox.showerror("힌트 오류", f"최적 전략 표를 준비하지 못했습니다.\n\n사유: {exc}")
+
+    def show_weather_error(self, exc: Exception) -> None:
+        if isinstance(exc, ApiConnectionError):
+            self.show_connection_error(exc)
+            return
+        messagebox.showerror("오류", f"날씨를 불러오는 중 예상하지 못한 오류가 발생했습니다.\n\n오류: {exc}")
+
+    def show_connection_error(self, exc: Exception) -> None:
+        messagebox.showerror(
+            "인터넷 연결 필요",
+            "Open-Meteo API에 연결할 수 없습니다.\n"
+            "인터넷 상태 또는 SSL 인증서를 확인한 뒤 다시 시도해주세요.\n\n"
+            f"오류: {exc}",
+        )
+
+    @profiled("fetch_weather")
     def fetch_weather(
         self,
         city: str,
         latitude: float | None = None,
         longitude: float | None = None,
+        persist_geocode: bool = True,
     ) -> dict | None:
-        if requests is None:
-            return None
-
         try:
             target_lat = latitude
             target_lon = longitude
 
             if target_lat is None or target_lon is None:
-                geo_url = (
-                    "https://geocoding-api.open-meteo.com/v1/search?"
-                    f"name={quote(city)}&count=1&language=ko&format=json"
-                )
-                geo_resp = requests.get(geo_url, timeout=10)
-                geo_resp.raise_for_status()
-                geo_data = geo_resp.json()
-                if not geo_data.get("results"):
+                location = self.geocode_city(city, persist_geocode)
+                if location is None:
                     return None
-                result = geo_data["results"][0]
-                target_lat = result["latitude"]
-                target_lon = result["longitude"]
+                target_lat, target_lon, _ = location
 
-            weather_url = (
-                "https://api.open-meteo.com/v1/forecast?"
-                f"latitude={target_lat}&longitude={target_lon}&current=temperature_2m,weather_code"
-            )
-            weather_resp = requests.get(weather_url, timeout=10)
-            weather_resp.raise_for_status()
-            weather_data = weather_resp.json()
-            current = weather_data.get("current")
-            if not current:
-                return None
-            temperature = current.get("temperature_2m")
-            code = current.get("weather_code", 1)
-            condition = classify_weather(code)
-            return {
-                "temperature": temperature,
-                "code": code,
-                "condition": condition,
-                "latitude": target_lat,
-                "longitude": target_lon,
-            }
-        except Exception:
+            cached = self.weather_cache.get(target_lat, target_lon)
+            if cached is not None:
+                return cached
+
+            weather = self.request_current_weather(target_lat, target_lon)
+            if weather is not None:
+                self.weather_cache.put(target_lat, target_lon, weather)
+            return weather
+        except Exception as exc:
+            if is_request_error(exc) and is_connection_failure(exc):
+                raise ApiConnectionError(exc) from exc
             return None
 
+    def request_current_weather(self, latitude: float, longitude: float) -> dict | None:
+        return self.request_weather_batch([(latitude, longitude)])[0]
+
+    def request_weather_batch(self, locations: list[tuple[float, float]]) -> list[dict | None]:
+        latitudes = ",".join(str(latitude) for latitude, _ in locations)
+        longitudes = ",".join(str(longitude) for _, longitude in locations)
+        weather_url = (
+            "https://api.open-meteo.com/v1/forecast?"
+            f"latitude={latitudes}&longitude={longitudes}&current=temperature_2m,weather_code"
+            f"&hourly=temperature_2m,weather_code&forecast_hours={HOURLY_FORECAST_HOURS}&timeformat=unixtime"
+        )
+        weather_resp = self.http_session.get(weather_url, timeout=HTTP_TIMEOUT)
+        weather_resp.raise_for_status()
+        results = weather_resp.json()
+        if not isinstance(results, list):
+            results = [results]
+        return [
+            self.parse_weather(results[idx] if idx < len(results) else None, latitude, longitude)
+            for idx, (latitude, longitude) in enumerate(locations)
+        ]
+
+    def parse_weather(self, weather_data: dict | None, latitude: float, longitude: float) -> dict | None:
+        if not weather_data:
+            return None
+        current = weather_data.get("current")
+        if not current:
+            return None
+        temperature = current.get("temperature_2m")
+        code = current.get("weather_code", 1)
+        condition = classify_weather(code)
+        return {
+            "temperature": temperature,
+            "code": code,
+            "condition": condition,
+            "latitude": latitude,
+            "longitude": longitude,
+            "hourly": self.parse_hourly(weather_data.get("hourly")),
+        }
+
+    def parse_hourly(self, hourly: dict | None) -> dict | None:
+        if not hourly or not hourly.get("time"):
+            return None
+        codes = [1 if code is None else int(code) for code in hourly.get("weather_code") or []]
+        if not codes:
+            return None
+        temperatures = [None if temp is None else round(temp, 1) for temp in hourly.get("temperature_2m") or []]
+        return {"start": int(hourly["time"][0]), "codes": codes, "temperatures": temperatures}
+
+    def geocode_city(self, city: str, persist: bool = True) -> tuple[float, float, str] | None:
+        cached = self.geocode_cache.get(city)
+        if cached is not None:
+            return cached
+        local = self.city_index.lookup(city)
+        if local is not None:
+            return (*local, city)
+        return self.request_geocode(city, persist)
+
+    def request_geocode(self, city: str, persist: bool = True) -> tuple[float, float, str] | None:
+        geo_url = (
+            "https://geocoding-api.open-meteo.com/v1/search?"
+            f"name={quote(city)}&count=1&language=ko&format=json"
+        )
+        geo_resp = self.http_session.get(geo_url, timeout=HTTP_TIMEOUT)
+        geo_resp.raise_for_status()
+        geo_data = geo_resp.json()
+        if not geo_data.get("results"):
+            return None
+        result = geo_data["results"][0]
+        location = (result["latitude"], result["longitude"], result.get("name") or city)
+        self.geocode_cache.put(city, *location, persist=persist)
+        if persist:
+            self.city_index.add(*location)
+        return location
+
+    @profiled("apply_theme")
     def apply_theme(self, condition: str) -> None:
+        previous = self.current_theme
         self.current_theme = WEATHER_THEMES.get(condition, WEATHER_THEMES["cloudy"])
-        for frame in self.frames.values():
-            frame.configure(bg=self.current_theme["bg"])
         self.root.configure(bg=self.current_theme["bg"])
-        self.build_start_frame()
-        self.build_setup_frame()
-        self.build_game_frame()
+        if self.current_theme is previous:
+            return
+        for name, frame in self.frames.items():
+            if name in self.built_frames:
+                self.retheme_widget(frame, previous)
+            else:
+                frame.configure(bg=self.current_theme["bg"])
 
-    def setup_scoreboard(self) -> None:
-        for widget in self.score_frame.winfo_children():
-            widget.destroy()
+    def retheme_widget(self, widget: tk.Misc, previous: dict) -> None:
+        theme = self.current_theme
+        for option, key in RETHEME_OPTIONS:
+            try:
+                if widget.cget(option) == previous[key]:
+                    widget.configure({option: theme[key]})
+            except tk.TclError:
+                continue
+        for child in widget.winfo_children():
+            self.retheme_widget(child, previous)
 
+    def build_scoreboard_labels(self) -> None:
         header_font = ("Helvetica", 16, "bold")
         cell_font = ("Helvetica", 14)
 
@@ -918,19 +2167,6 @@ class WeatherYachtApp:
             width=22,
         ).grid(row=0, column=0, padx=5, pady=5)
 
-        self.score_labels = {code: [] for code, _ in CATEGORIES}
-        self.total_labels = []
-
-        for col, player in enumerate(self.players, start=1):
-            tk.Label(
-                self.score_frame,
-                text=player["name"],
-                font=header_font,
-                bg=self.current_theme["bg"],
-                fg=self.current_theme["fg"],
-                width=12,
-            ).grid(row=0, column=col, padx=5, pady=5)
-
         for row, (code, display) in enumerate(CATEGORIES, start=1):
             tk.Label(
                 self.score_frame,
@@ -941,21 +2177,7 @@ class WeatherYachtApp:
                 width=22,
                 anchor="w",
             ).grid(row=row, column=0, padx=5, pady=3, sticky="w")
-            for col in range(len(self.players)):
-                lbl = tk.Label(
-                    self.score_frame,
-                    text="-",
-                    font=cell_font,
-                    bg="white",
-                    fg="black",
-                    width=10,
-                    relief="ridge",
-                    borderwidth=2,
-                )
-                lbl.grid(row=row, column=col + 1, padx=3, pady=3)
-                self.score_labels[code].append(lbl)
 
-        total_row = len(CATEGORIES) + 1
         tk.Label(
             self.score_frame,
             text="총점",
@@ -963,32 +2185,119 @@ class WeatherYachtApp:
             bg=self.current_theme["bg"],
             fg=self.current_theme["fg"],
             width=22,
-        ).grid(row=total_row, column=0, padx=5, pady=5)
+        ).grid(row=len(CATEGORIES) + 1, column=0, padx=5, pady=5)
+
+        self.player_header_labels = []
+        self.score_labels = {code: [] for code, _ in CATEGORIES}
+        self.total_labels = []
 
-        for col in range(len(self.players)):
+    def add_scoreboard_column(self) -> None:
+        header_font = ("Helvetica", 16, "bold")
+        cell_font = ("Helvetica", 14)
+        col = len(self.player_header_labels) + 1
+
+        header = tk.Label(
+            self.score_frame,
+            font=header_font,
+            bg=self.current_theme["bg"],
+            fg=self.current_theme["fg"],
+            width=12,
+        )
+        header.grid(row=0, column=col, padx=5, pady=5)
+        self.player_header_labels.append(header)
+
+        for row, (code, _) in enumerate(CATEGORIES, start=1):
             lbl = tk.Label(
                 self.score_frame,
-                text="0",
-                font=header_font,
-                bg=self.current_theme["bg"],
-                fg=self.current_theme["fg"],
+                text="-",
+                font=cell_font,
+                bg="white",
+                fg="black",
                 width=10,
+                relief="ridge",
+                borderwidth=2,
             )
-            lbl.grid(row=total_row, column=col + 1, padx=5, pady=5)
-            self.total_labels.append(lbl)
+            lbl.grid(row=row, column=col, padx=3, pady=3)
+            self.score_labels[code].append(lbl)
+
+        total = tk.Label(
+            self.score_frame,
+            text="0",
+            font=header_font,
+            bg=self.current_theme["bg"],
+            fg=self.current_theme["fg"],
+            width=10,
+        )
+        total.grid(row=len(CATEGORIES) + 1, column=col, padx=5, pady=5)
+        self.total_labels.append(total)
+
+    def remove_scoreboard_column(self) -> None:
+        removed = [self.player_header_labels.pop(), self.total_labels.pop()]
+        removed.extend(labels.pop() for labels in self.score_labels.values())
+        for widget in removed:
+            self.widget_options.pop(widget, None)
+            widget.destroy()
+
+    def show_scoreboard_view(self, use_tree: bool) -> None:
+        if use_tree == self.score_tree_active:
+            return
+        self.score_tree_active = use_tree
+        if use_tree:
+            for widget in (self.score_canvas, self.score_scrollbar, self.score_xscrollbar):
+                widget.pack_forget()
+            self.score_tree_frame.pack(fill="both", expand=True)
+        else:
+            self.score_tree_frame.pack_forget()
+            self.score_canvas.pack(side="left", fill="both", expand=True)
+            self.score_scrollbar.pack(side="right", fill="y")
+            self.score_xscrollbar.pack(side="bottom", fill="x")
+
+    def setup_score_tree(self) -> None:
+        tree = self.score_tree
+        tree.delete(*tree.get_children())
+        for idx, player in enumerate(self.players):
+            values = [player.name]
+            values.extend(player.scores.get(code, "-") for code, _ in CATEGORIES)
+            values.append(player.total)
+            tree.insert("", "end", iid=str(idx), values=values)
+        tree.yview_moveto(0)
+
+    @profiled("setup_scoreboard")
+    def setup_scoreboard(self) -> None:
+        players = self.players
+        use_tree = len(players) > GRID_MAX_PLAYERS
+        self.show_scoreboard_view(use_tree)
+        if use_tree:
+            while self.player_header_labels:
+                self.remove_scoreboard_column()
+            self.setup_score_tree()
+            return
 
-        self.score_frame.update_idletasks()
-        if hasattr(self, "score_canvas"):
+        columns_changed = len(self.player_header_labels) != len(players)
+        while len(self.player_header_labels) > len(players):
+            self.remove_scoreboard_column()
+        while len(self.player_header_labels) < len(players):
+            self.add_scoreboard_column()
+
+        for col, player in enumerate(players):
+            self.set_widget(self.player_header_labels[col], text=player.name)
+            self.set_widget(self.total_labels[col], text=str(player.total))
+            for code, labels in self.score_labels.items():
+                score = player.scores.get(code)
+                self.set_widget(labels[col], text="-" if score is None else str(score))
+
+        if columns_changed:
+            self.score_frame.update_idletasks()
             self.score_canvas.configure(scrollregion=self.score_canvas.bbox("all"))
-            self.score_canvas.yview_moveto(0)
+        self.score_canvas.yview_moveto(0)
 
-    def show_loading(self, message: str) -> tk.Toplevel:
+    def show_loading(self, message: str, on_cancel=None) -> tk.Toplevel:
         self.root.update_idletasks()
         top = tk.Toplevel(self.root)
         top.title("연결 중...")
         top.resizable(False, False)
         top.configure(bg=self.current_theme["bg"])
-        width, height = 320, 160
+        width, height = 320, 200 if on_cancel is not None else 160
         root_x = self.root.winfo_rootx()
         root_y = self.root.winfo_rooty()
         root_w = self.root.winfo_width()
@@ -998,7 +2307,7 @@ class WeatherYachtApp:
         top.geometry(f"{width}x{height}+{x_pos}+{y_pos}")
         top.transient(self.root)
         top.grab_set()
-        top.protocol("WM_DELETE_WINDOW", lambda: None)
+        top.protocol("WM_DELETE_WINDOW", on_cancel or (lambda: None))
 
         tk.Label(
             top,
@@ -1014,6 +2323,15 @@ class WeatherYachtApp:
         progress.pack(pady=10)
         progress.start(10)
         top.progressbar = progress  # type: ignore[attr-defined]
+
+        if on_cancel is not None:
+            tk.Button(
+                top,
+                text="취소",
+                font=("Helvetica", 12),
+                width=10,
+                command=on_cancel,
+            ).pack(pady=(5, 10))
         top.update_idletasks()
         return top
 
@@ -1030,16 +2348,11 @@ class WeatherYachtApp:
             pass
 
     def reset_game_state(self) -> None:
-        self.dice = [0] * 5
-        self.held = [False] * 5
-        self.rolls_left = 3
-        self.current_player_index = 0
+        self.engine.state.current_player_index = 0
+        self.engine.start_turn()
         self.status_var.set("")
         self.weather_info_var.set(self.describe_weather())
-        self.update_dice_display()
-        self.update_rolls_label()
-        self.update_category_buttons()
-        self.update_ability_button()
+        self.invalidate("rolls", "dice", "categories", "ability")
 
     def describe_weather(self) -> str:
         city = self.weather_context["city"]
@@ -1048,60 +2361,111 @@ class WeatherYachtApp:
         theme = WEATHER_THEMES.get(condition_key, WEATHER_THEMES["cloudy"])
         ability_name = theme["ability_name"]
         if temp is None:
-            return f"{city}: {ability_name}"
-        return f"{city}: {temp:.1f}°C, {ability_name}"
+            text = f"{city}: {ability_name}"
+        else:
+            text = f"{city}: {temp:.1f}°C, {ability_name}"
+        if not self.weather_context.get("stale"):
+            return text
+        fetched_at = self.weather_context.get("fetched_at")
+        age = "" if fetched_at is None else f"{max(0, int((time.time() - fetched_at) // 60))}분 전 "
+        if self.is_task_active(self._revalidate_task):
+            return f"{text} ({age}이전 날씨, 갱신 중...)"
+        return f"{text} ({age}이전 날씨)"
 
     def start_turn(self) -> None:
-        player = self.players[self.current_player_index]
-        self.dice = [0] * 5
-        self.held = [False] * 5
-        self.rolls_left = 3
-        self.status_var.set(f"{player['name']} 차례입니다. 주사위를 굴려주세요.")
-        self.current_player_label.config(text=f"현재 플레이어: {player['name']}")
-        self.update_rolls_label()
-        self.update_dice_display()
-        self.update_category_buttons()
-        self.update_ability_button()
+        self.engine.start_turn()
+        self.apply_player_weather()
+        player = self.engine.state.current_player
+        if player.ability_used:
+            self.status_var.set(f"{player.name}은(는) 이미 찬스를 사용했습니다.")
+        else:
+            self.status_var.set(f"{player.name} 차례입니다. {self.current_theme['ability_desc']}")
+        self.invalidate("player", "rolls", "dice", "categories", "ability")
 
     def roll_dice(self) -> None:
-        if self.rolls_left <= 0:
-            messagebox.showinfo("안내", "더 이상 굴릴 수 없습니다. 카테고리를 선택하세요.")
+        try:
+            self.engine.roll()
+        except GameRuleError as exc:
+            messagebox.showinfo("안내", str(exc))
             return
 
-        for idx in range(5):
-            if not self.held[idx]:
-                self.dice[idx] = random.randint(1, 6)
-
-        self.rolls_left -= 1
         self.status_var.set(
-            f"주사위를 굴렸습니다. 남은 굴림 {self.rolls_left}회."
+            f"주사위를 굴렸습니다. 남은 굴림 {self.engine.state.rolls_left}회."
         )
+        self.invalidate("rolls", "dice", "categories")
+
+    def invalidate(self, *parts: str) -> None:
+        self.dirty_parts.update(parts)
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            self.root.after_idle(self.flush_refresh)
+
+    def flush_refresh(self) -> None:
+        self.refresh_pending = False
+        dirty, self.dirty_parts = self.dirty_parts, set()
+        if "game" not in self.built_frames:
+            return
+        before = self.refresh_stats["config_calls"]
+        for part in REFRESH_ORDER:
+            if part in dirty:
+                getattr(self, f"refresh_{part}")()
+        stats = self.refresh_stats
+        stats["flushes"] += 1
+        stats["last_config_calls"] = stats["config_calls"] - before
+        if self.refresh_debug:
+            parts = ", ".join(part for part in REFRESH_ORDER if part in dirty)
+            print(
+                f"[refresh #{stats['flushes']}] {parts}: config {stats['last_config_calls']}회",
+                file=sys.stderr,
+            )
+
+    def set_widget(self, widget: tk.Misc, **options) -> None:
+        cached = self.widget_options.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if cached.get(key) != value}
+        if not changed:
+            return
+        widget.config(**changed)
+        cached.update(changed)
+        self.refresh_stats["config_calls"] += 1
+
+    def refresh_player(self) -> None:
+        if self.players:
+            player = self.engine.state.current_player
+            self.set_widget(self.current_player_label, text=f"현재 플레이어: {player.name}")
+            if self.score_tree_active:
+                item = str(self.engine.state.current_player_index)
+                self.score_tree.selection_set(item)
+                self.score_tree.see(item)
+
+    def refresh_rolls(self) -> None:
         self.update_rolls_label()
-        self.update_dice_display()
 
-    def force_reroll(self) -> None:
-        self.held = [False] * 5
-        for idx in range(5):
-            self.dice[idx] = random.randint(1, 6)
-        self.status_var.set("번개 찬스로 주사위를 다시 굴렸습니다.")
+    def refresh_dice(self) -> None:
         self.update_dice_display()
 
+    def refresh_categories(self) -> None:
+        self.update_category_buttons()
+
+    def refresh_ability(self) -> None:
+        self.update_ability_button()
+
     def update_rolls_label(self) -> None:
-        self.rolls_label.config(text=f"남은 굴림: {self.rolls_left}")
+        self.set_widget(self.rolls_label, text=f"남은 굴림: {self.engine.state.rolls_left}")
 
+    @profiled("update_dice_display")
     def update_dice_display(self) -> None:
         if not hasattr(self, "dice_views"):
             return
+        state = self.engine.state
+        theme_fg = self.current_theme["fg"]
         for idx, view in enumerate(self.dice_views):
-            value = self.dice[idx]
-            view.render(value, self.held[idx], self.current_theme["fg"])
-        self.update_category_buttons()
+            if view.rendered != (state.dice[idx], state.held[idx], theme_fg):
+                view.render(state.dice[idx], state.held[idx], theme_fg)
+                self.refresh_stats["config_calls"] += 1
 
     def toggle_hold(self, index: int) -> None:
-        if self.dice[index] == 0:
-            return
-        self.held[index] = not self.held[index]
-        self.update_dice_display()
+        if self.engine.toggle_hold(index):
+            self.invalidate("dice")
 
     def _widget_is_within(self, widget, container) -> bool:
         if widget is None or container is None:
@@ -1167,86 +2531,83 @@ class WeatherYachtApp:
 
         return None
 
+    @profiled("update_category_buttons")
     def update_category_buttons(self) -> None:
         if not getattr(self, "category_buttons", None):
             return
         if not self.players:
             return
 
-        player = self.players[self.current_player_index]
-        dice_ready = all(value > 0 for value in self.dice)
-        bonus = player.get("pending_bonus", 0)
+        state = self.engine.state
+        player = state.current_player
+        dice_ready = all(value > 0 for value in state.dice)
+        bonus = player.pending_bonus
+        scores = score_all(state.dice) if dice_ready else ZERO_SCORES
 
         for code, button in self.category_buttons.items():
             base_text = CATEGORY_DISPLAY_MAP.get(code, code)
-            if code in player["scores"]:
-                button.config(state="disabled", text=f"{base_text} (기록됨)")
+            if code in player.scores:
+                self.set_widget(button, state="disabled", text=f"{base_text} (기록됨)")
                 continue
 
-            button.config(state="normal")
             if dice_ready:
-                expected = calculate_score(code, self.dice)
+                expected = scores[CATEGORY_INDEX[code]]
                 total_expected = expected + bonus
                 if bonus:
-                    button.config(text=f"{base_text} (예상 {total_expected}점, 보너스 포함)")
+                    text = f"{base_text} (예상 {total_expected}점, 보너스 포함)"
                 else:
-                    button.config(text=f"{base_text} (예상 {expected}점)")
+                    text = f"{base_text} (예상 {expected}점)"
             else:
-                button.config(text=base_text)
+                text = base_text
+            self.set_widget(button, state="normal", text=text)
 
     def update_ability_button(self) -> None:
         if not hasattr(self, "ability_button"):
             return
+        name = self.current_theme["ability_name"]
         if not self.players:
-            theme = self.current_theme
-            self.ability_button.config(
-                text=f"{theme['ability_name']} 사용",
-                state="disabled",
-            )
-            self.status_var.set("")
+            self.set_widget(self.ability_button, text=f"{name} 사용", state="disabled")
             return
 
-        player = self.players[self.current_player_index]
-        theme = self.current_theme
-        desc = theme["ability_desc"]
-        name = theme["ability_name"]
-        self.ability_button.config(text=f"{name} 사용")
-
-        if player["ability_used"]:
-            self.ability_button.config(state="disabled")
-            self.status_var.set(f"{player['name']}은(는) 이미 찬스를 사용했습니다.")
-        else:
-            self.ability_button.config(state="normal")
-            self.status_var.set(f"{player['name']} 차례입니다. {desc}")
+        player = self.engine.state.current_player
+        self.set_widget(
+            self.ability_button,
+            text=f"{name} 사용",
+            state="disabled" if player.ability_used else "normal",
+        )
 
     def use_weather_ability(self) -> None:
-        player = self.players[self.current_player_index]
-        if player["ability_used"]:
+        player = self.engine.state.current_player
+        if player.ability_used:
             messagebox.showinfo("안내", "이미 찬스를 사용했습니다.")
             return
 
         ability = self.current_theme["ability_key"]
         applied = False
 
-        if ability == "set_die_to_six":
-            applied = self.ability_set_die()
-        elif ability == "reroll_selected":
-            applied = self.ability_reroll_selected()
-        elif ability == "add_five_points":
-            player["pending_bonus"] += 5
-            self.status_var.set("빗방울 찬스를 사용했습니다! 다음 점수에 +5점이 추가됩니다.")
-            applied = True
-        elif ability == "swap_dice":
-            applied = self.ability_swap_dice()
-        elif ability == "full_reroll":
-            applied = self.ability_full_reroll()
+        try:
+            if ability == "set_die_to_six":
+                applied = self.ability_set_die()
+            elif ability == "reroll_selected":
+                applied = self.ability_reroll_selected()
+            elif ability == "add_five_points":
+                self.engine.use_ability()
+                self.status_var.set("빗방울 찬스를 사용했습니다! 다음 점수에 +5점이 추가됩니다.")
+                self.invalidate("categories")
+                applied = True
+            elif ability == "swap_dice":
+                applied = self.ability_swap_dice()
+            elif ability == "full_reroll":
+                applied = self.ability_full_reroll()
+        except GameRuleError as exc:
+            messagebox.showinfo("안내", str(exc))
+            return
 
         if applied:
-            player["ability_used"] = True
-            self.ability_button.config(state="disabled")
+            self.invalidate("ability")
 
     def ability_set_die(self) -> bool:
-        if all(value == 0 for value in self.dice):
+        if not self.engine.state.dice_rolled:
             messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
             return False
         index = simpledialog.askinteger(
@@ -1258,13 +2619,13 @@ class WeatherYachtApp:
         )
         if index is None:
             return False
-        self.dice[index - 1] = 6
+        self.engine.use_ability(index - 1)
         self.status_var.set("햇살 찬스로 주사위 하나를 6으로 변경했습니다.")
-        self.update_dice_display()
+        self.invalidate("dice", "categories")
         return True
 
     def ability_reroll_selected(self) -> bool:
-        if all(value == 0 for value in self.dice):
+        if not self.engine.state.dice_rolled:
             messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
             return False
         raw = simpledialog.askstring(
@@ -1286,16 +2647,13 @@ class WeatherYachtApp:
             if part < 1 or part > 5:
                 messagebox.showerror("오류", "주사위 위치는 1에서 5 사이입니다.")
                 return False
-        for part in parts:
-            idx = part - 1
-            self.held[idx] = False
-            self.dice[idx] = random.randint(1, 6)
+        self.engine.use_ability([part - 1 for part in parts])
         self.status_var.set("바람 찬스로 선택한 주사위를 다시 굴렸습니다.")
-        self.update_dice_display()
+        self.invalidate("dice", "categories")
         return True
 
     def ability_swap_dice(self) -> bool:
-        if all(value == 0 for value in self.dice):
+        if not self.engine.state.dice_rolled:
             messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
             return False
         raw = simpledialog.askstring(
@@ -1313,86 +2671,73 @@ class WeatherYachtApp:
         if first < 1 or first > 5 or second < 1 or second > 5:
             messagebox.showerror("오류", "주사위 위치는 1에서 5 사이입니다.")
             return False
-        idx1 = first - 1
-        idx2 = second - 1
-        self.dice[idx1], self.dice[idx2] = self.dice[idx2], self.dice[idx1]
+        self.engine.use_ability(first - 1, second - 1)
         self.status_var.set("눈꽃 찬스로 두 주사위의 값을 서로 바꿨습니다.")
-        self.update_dice_display()
+        self.invalidate("dice", "categories")
         return True
 
     def ability_full_reroll(self) -> bool:
-        if all(value == 0 for value in self.dice):
+        if not self.engine.state.dice_rolled:
             messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
             return False
-        self.force_reroll()
+        self.engine.use_ability()
+        self.status_var.set("번개 찬스로 주사위를 다시 굴렸습니다.")
+        self.invalidate("dice", "categories")
         return True
 
     def record_score(self, category: str) -> None:
-        player = self.players[self.current_player_index]
-        if category in player["scores"]:
-            messagebox.showinfo("안내", "이미 기록한 카테고리입니다.")
-            return
-        if all(value == 0 for value in self.dice):
-            messagebox.showinfo("안내", "먼저 주사위를 굴려주세요.")
+        state = self.engine.state
+        bonus = state.current_player.pending_bonus
+        try:
+            score = self.engine.record_score(category)
+        except GameRuleError as exc:
+            messagebox.showinfo("안내", str(exc))
             return
 
-        score = calculate_score(category, self.dice)
-        bonus = player.get("pending_bonus", 0)
         if bonus:
-            score += bonus
-            player["pending_bonus"] = 0
             self.status_var.set(f"찬스 보너스로 +{bonus}점이 추가되었습니다.")
         else:
             self.status_var.set("")
 
-        player["scores"][category] = score
-        self.score_labels[category][self.current_player_index].config(text=str(score))
-        self.update_totals()
+        idx = state.current_player_index
+        if self.score_tree_active:
+            self.score_tree.set(str(idx), category, score)
+            self.score_tree.set(str(idx), "total", state.players[idx].total)
+        else:
+            self.set_widget(self.score_labels[category][idx], text=str(score))
+            self.set_widget(self.total_labels[idx], text=str(state.players[idx].total))
         self.advance_turn()
 
-    def update_totals(self) -> None:
-        for idx, player in enumerate(self.players):
-            total = sum(player["scores"].values())
-            self.total_labels[idx].config(text=str(total))
-
     def advance_turn(self) -> None:
-        finished = all(
-            len(player["scores"]) == len(CATEGORIES) for player in self.players
-        )
-        if finished:
+        if self.engine.advance_turn():
             self.finish_game()
             return
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
         self.start_turn()
 
     def finish_game(self) -> None:
-        totals = [sum(player["scores"].values()) for player in self.players]
-        max_score = max(totals)
-        winners = [
-            player["name"] for player, total in zip(self.players, totals) if total == max_score
-        ]
+        winners, max_score = self.engine.winners()
         if len(winners) == 1:
-            winner_text = f"우승자는 {winners[0]}! 점수: {max_score}"
+            winner_text = f"우승자는 {winners[0].name}! 점수: {max_score}"
         else:
-            names = ", ".join(winners)
+            names = ", ".join(player.name for player in winners)
             winner_text = f"공동 우승: {names}! 점수: {max_score}"
 
-        detail_lines = [
-            f"{player['name']}: {total}점"
-            for player, total in zip(self.players, totals)
-        ]
+        ranking = self.players
+        if len(ranking) > RESULT_DETAIL_LIMIT:
+            ranking = sorted(ranking, key=lambda player: player.total, reverse=True)
+        detail_lines = [f"{player.name}: {player.total}점" for player in ranking[:RESULT_DETAIL_LIMIT]]
+        if len(ranking) > RESULT_DETAIL_LIMIT:
+            detail_lines.append(f"... 외 {len(ranking) - RESULT_DETAIL_LIMIT}명")
         messagebox.showinfo("게임 종료", winner_text + "\n\n" + "\n".join(detail_lines))
 
         retry = messagebox.askyesno("다시 플레이", "다시 플레이하시겠습니까?")
         if retry:
-            for player in self.players:
-                player["scores"].clear()
-                player["ability_used"] = False
-                player["pending_bonus"] = 0
+            self.engine.restart()
             self.setup_scoreboard()
             self.reset_game_state()
             self.start_turn()
         else:
+            self.cancel_hourly_weather()
             self.show_frame("start")
 
     def confirm_return_to_start(self) -> None:
@@ -1401,7 +2746,8 @@ class WeatherYachtApp:
             "현재 진행 중인 게임을 중단하고 처음 화면으로 돌아가시겠습니까?",
         ):
             return
-        self.players.clear()
+        self.cancel_hourly_weather()
+        self.engine.new_game([])
         self.reset_game_state()
         self.show_frame("start")
 
@@ -1477,6 +2823,7 @@ class WeatherYachtApp:
         ).pack(pady=10)
 
     def show_frame(self, name: str) -> None:
+        self.ensure_frame(name)
         for frame_name, frame in self.frames.items():
             if frame_name == name:
                 frame.pack(fill="both", expand=True)
@@ -1485,15 +2832,28 @@ class WeatherYachtApp:
                 frame.pack_forget()
 
 
+def report_startup_time(app: WeatherYachtApp, started: float) -> None:
+    app.startup_seconds = time.perf_counter() - started
+    if app.profiler.enabled:
+        app.profiler.record("startup", app.startup_seconds)
+        app.show_profile_overlay()
+    if os.environ.get(STARTUP_DEBUG_ENV):
+        print(
+            f"시작 화면 표시까지 {app.startup_seconds * 1000:.0f}ms "
+            f"(생성된 화면: {', '.join(sorted(app.built_frames))})",
+            file=sys.stderr,
+        )
+
+
 def main() -> None:
+    started = time.perf_counter()
     root = tk.Tk()
-    root.withdraw()
-    if not ensure_requests(root, show_success=False):
-        root.destroy()
-        return
-    root.deiconify()
     app = WeatherYachtApp(root)
-    root.mainloop()
+    root.after_idle(report_startup_time, app, started)
+    try:
+        root.mainloop()
+    finally:
+        app.shutdown()
 
 
 if __name__ == "__main__":
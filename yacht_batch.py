@@ -0,0 +1,91 @@
+import random
+import sys
+import time
+
+from yacht_rules import CATEGORIES, ROLL_INDEX_OFFSET, ROLL_PLACE_VALUES, score_all, score_tables
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+DICE_COUNT = 5
+DIE_DTYPE = "int8"
+
+_roll_scores = None
+_place_values = None
+
+
+def roll_score_matrix():
+    global _roll_scores, _place_values
+    if _roll_scores is None:
+        roll_to_multiset, multiset_scores = score_tables()
+        scores = np.array(multiset_scores, dtype=np.int16)[np.frombuffer(roll_to_multiset, dtype=np.uint8)]
+        scores.setflags(write=False)
+        _place_values = np.array(ROLL_PLACE_VALUES, dtype=np.int32)
+        _roll_scores = scores
+    return _roll_scores
+
+
+def roll_batch(rng, count: int):
+    return rng.integers(1, 7, size=(count, DICE_COUNT), dtype=DIE_DTYPE)
+
+
+def reroll_batch(rng, dice, held=None):
+    fresh = rng.integers(1, 7, size=dice.shape, dtype=dice.dtype)
+    if held is None:
+        dice[...] = fresh
+    else:
+        np.copyto(dice, fresh, where=~np.asarray(held, dtype=bool))
+    return dice
+
+
+def roll_indices(dice):
+    roll_score_matrix()
+    return np.asarray(dice, dtype=np.int32) @ _place_values - ROLL_INDEX_OFFSET
+
+
+def score_batch(dice):
+    dice = np.asarray(dice)
+    if dice.shape[-1:] != (DICE_COUNT,):
+        raise ValueError(f"주사위 배열의 마지막 차원은 {DICE_COUNT}이어야 합니다: {dice.shape}")
+    table = roll_score_matrix()
+    valid = ((dice >= 1) & (dice <= 6)).all(axis=-1)
+    if valid.all():
+        return table[roll_indices(dice)]
+    scores = table[roll_indices(np.where(valid[..., None], dice, 1))]
+    scores[~valid] = 0
+    return scores
+
+
+def main() -> None:
+    if np is None:
+        print("배치 주사위 시뮬레이션에는 numpy가 필요합니다.", file=sys.stderr)
+        sys.exit(1)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    roll_score_matrix()
+
+    started = time.perf_counter()
+    dice = roll_batch(rng, count)
+    held = dice == np.sort(dice, axis=1)[:, DICE_COUNT // 2, None]
+    reroll_batch(rng, dice, held)
+    scores = score_batch(dice)
+    batch_elapsed = time.perf_counter() - started
+
+    sample = min(count, 100_000)
+    scalar_rng = random.Random(0)
+    started = time.perf_counter()
+    for _ in range(sample):
+        score_all([scalar_rng.randint(1, 6) for _ in range(DICE_COUNT)])
+    scalar_elapsed = (time.perf_counter() - started) * count / sample
+
+    print(f"배치: {count}회 굴림+재굴림+채점 {batch_elapsed:.3f}s ({count / batch_elapsed:,.0f}회/초)")
+    print(f"단일: 같은 양을 파이썬 루프로 약 {scalar_elapsed:.3f}s ({count / scalar_elapsed:,.0f}회/초)")
+    means = scores.mean(axis=0)
+    print(", ".join(f"{code} {mean:.2f}" for (code, _), mean in zip(CATEGORIES, means)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import bisect
+import threading
+
+SUGGESTION_LIMIT = 8
+
+CITY_TABLE = """\
+Seoul|서울|37.57|126.98
+Busan|부산|35.18|129.08
+Incheon|인천|37.46|126.71
+Daegu|대구|35.87|128.60
+Daejeon|대전|36.35|127.38
+Gwangju|광주|35.16|126.85
+Ulsan|울산|35.54|129.31
+Sejong|세종|36.48|127.29
+Suwon|수원|37.26|127.03
+Seongnam|성남|37.42|127.13
+Goyang|고양|37.66|126.83
+Yongin|용인|37.24|127.18
+Changwon|창원|35.23|128.68
+Cheongju|청주|36.64|127.49
+Jeonju|전주|35.82|127.15
+Cheonan|천안|36.81|127.15
+Ansan|안산|37.32|126.83
+Anyang|안양|37.39|126.92
+Pohang|포항|36.02|129.34
+Gimhae|김해|35.23|128.89
+Jeju|제주|33.50|126.53
+Seogwipo|서귀포|33.25|126.56
+Chuncheon|춘천|37.88|127.73
+Gangneung|강릉|37.75|128.88
+Wonju|원주|37.34|127.92
+Sokcho|속초|38.21|128.59
+Yeosu|여수|34.76|127.66
+Suncheon|순천|34.95|127.49
+Mokpo|목포|34.81|126.39
+Gyeongju|경주|35.86|129.22
+Andong|안동|36.57|128.73
+Gumi|구미|36.12|128.34
+Jinju|진주|35.18|128.11
+Tongyeong|통영|34.85|128.43
+Gunsan|군산|35.97|126.74
+Iksan|익산|35.95|126.96
+Pyeongtaek|평택|36.99|127.09
+Hwaseong|화성|37.20|126.83
+Paju|파주|37.76|126.78
+Uijeongbu|의정부|37.74|127.03
+Gimpo|김포|37.62|126.72
+Namyangju|남양주|37.64|127.22
+Chungju|충주|36.99|127.93
+Jecheon|제천|37.13|128.19
+Geoje|거제|34.88|128.62
+Tokyo|도쿄|35.68|139.69
+Osaka|오사카|34.69|135.50
+Kyoto|교토|35.01|135.77
+Fukuoka|후쿠오카|33.59|130.40
+Sapporo|삿포로|43.06|141.35
+Beijing|베이징|39.90|116.41
+Shanghai|상하이|31.23|121.47
+Hong Kong|홍콩|22.32|114.17
+Taipei|타이베이|25.03|121.57
+Singapore|싱가포르|1.35|103.82
+Bangkok|방콕|13.76|100.50
+Hanoi|하노이|21.03|105.85
+Ho Chi Minh City|호찌민|10.82|106.63
+Manila|마닐라|14.60|120.98
+Jakarta|자카르타|-6.21|106.85
+Kuala Lumpur|쿠알라룸푸르|3.14|101.69
+New Delhi|뉴델리|28.61|77.21
+Mumbai|뭄바이|19.08|72.88
+Dubai|두바이|25.20|55.27
+Istanbul|이스탄불|41.01|28.98
+Moscow|모스크바|55.76|37.62
+London|런던|51.51|-0.13
+Paris|파리|48.86|2.35
+Berlin|베를린|52.52|13.40
+Rome|로마|41.90|12.50
+Madrid|마드리드|40.42|-3.70
+Barcelona|바르셀로나|41.39|2.17
+Amsterdam|암스테르담|52.37|4.90
+Vienna|빈|48.21|16.37
+Prague|프라하|50.08|14.44
+Zurich|취리히|47.38|8.54
+Stockholm|스톡홀름|59.33|18.07
+Helsinki|헬싱키|60.17|24.94
+Oslo|오슬로|59.91|10.75
+Copenhagen|코펜하겐|55.68|12.57
+Athens|아테네|37.98|23.73
+Lisbon|리스본|38.72|-9.14
+Cairo|카이로|30.04|31.24
+Nairobi|나이로비|-1.29|36.82
+Cape Town|케이프타운|-33.92|18.42
+New York|뉴욕|40.71|-74.01
+Los Angeles|로스앤젤레스|34.05|-118.24
+San Francisco|샌프란시스코|37.77|-122.42
+Seattle|시애틀|47.61|-122.33
+Chicago|시카고|41.88|-87.63
+Boston|보스턴|42.36|-71.06
+Washington|워싱턴|38.91|-77.04
+Toronto|토론토|43.65|-79.38
+Vancouver|밴쿠버|49.28|-123.12
+Honolulu|호놀룰루|21.31|-157.86
+Mexico City|멕시코시티|19.43|-99.13
+Sao Paulo|상파울루|-23.55|-46.63
+Buenos Aires|부에노스아이레스|-34.60|-58.38
+Lima|리마|-12.05|-77.04
+Sydney|시드니|-33.87|151.21
+Melbourne|멜버른|-37.81|144.96
+Auckland|오클랜드|-36.85|174.76
+Ulaanbaatar|울란바토르|47.89|106.91
+Vladivostok|블라디보스토크|43.12|131.89
+Pyongyang|평양|39.04|125.76
+"""
+
+
+def normalize_city(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def bundled_cities() -> list[tuple[str, str, float, float]]:
+    cities = []
+    for line in CITY_TABLE.splitlines():
+        name, local_name, latitude, longitude = line.split("|")
+        cities.append((name, local_name, float(latitude), float(longitude)))
+    return cities
+
+
+class CityIndex:
+    def __init__(self, loader=None) -> None:
+        self._loader = loader
+        self._keys: list[str] | None = None
+        self._entries: list[tuple[str, str, float, float]] = []
+        self._lock = threading.Lock()
+
+    def _ensure_built(self) -> list[str]:
+        if self._keys is not None:
+            return self._keys
+        entries: dict[str, tuple[str, str, float, float]] = {}
+        for name, local_name, latitude, longitude in bundled_cities():
+            entry = (name, f"{name} ({local_name})", latitude, longitude)
+            entries[normalize_city(name)] = entry
+            entries.setdefault(normalize_city(local_name), entry)
+        if self._loader is not None:
+            for _, latitude, longitude, name in self._loader():
+                entries.setdefault(normalize_city(name), (name, name, latitude, longitude))
+        self._keys = sorted(entries)
+        self._entries = [entries[key] for key in self._keys]
+        return self._keys
+
+    def add(self, latitude: float, longitude: float, name: str) -> None:
+        key = normalize_city(name)
+        with self._lock:
+            if self._keys is None:
+                return
+            position = bisect.bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                return
+            self._keys.insert(position, key)
+            self._entries.insert(position, (name, name, latitude, longitude))
+
+    def suggest(self, prefix: str, limit: int = SUGGESTION_LIMIT) -> list[tuple[str, str, float, float]]:
+        key = normalize_city(prefix)
+        if not key:
+            return []
+        found = []
+        seen = set()
+        with self._lock:
+            keys = self._ensure_built()
+            for position in range(bisect.bisect_left(keys, key), len(keys)):
+                if not keys[position].startswith(key):
+                    break
+                entry = self._entries[position]
+                if entry[0] in seen:
+                    continue
+                seen.add(entry[0])
+                found.append(entry)
+                if len(found) == limit:
+                    break
+        return found
+
+    def lookup(self, city: str) -> tuple[float, float] | None:
+        key = normalize_city(city)
+        with self._lock:
+            keys = self._ensure_built()
+            position = bisect.bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                _, _, latitude, longitude = self._entries[position]
+                return latitude, longitude
+        return None
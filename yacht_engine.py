@@ -0,0 +1,233 @@
+import random
+
+from yacht_rules import CATEGORIES, CATEGORY_INDEX, RAIN_BONUS, score_all
+
+DICE_COUNT = 5
+ROLLS_PER_TURN = 3
+
+
+class GameRuleError(ValueError):
+    pass
+
+
+class PlayerState:
+    __slots__ = ("name", "ability_key", "scores", "ability_used", "pending_bonus", "total", "filled", "filled_mask")
+
+    def __init__(self, name: str, ability_key: str | None = None) -> None:
+        self.name = name
+        self.ability_key = ability_key
+        self.scores: dict[str, int] = {}
+        self.ability_used = False
+        self.pending_bonus = 0
+        self.total = 0
+        self.filled = 0
+        self.filled_mask = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.filled == len(CATEGORIES)
+
+    def reset(self) -> None:
+        self.scores.clear()
+        self.ability_used = False
+        self.pending_bonus = 0
+        self.total = 0
+        self.filled = 0
+        self.filled_mask = 0
+
+
+class GameState:
+    __slots__ = (
+        "players",
+        "ability_key",
+        "current_player_index",
+        "dice",
+        "held",
+        "rolls_left",
+        "turns_left",
+        "best_total",
+        "leaders",
+    )
+
+    def __init__(self, names, ability_key: str, player_abilities=None) -> None:
+        names = list(names)
+        abilities = list(player_abilities) if player_abilities is not None else [None] * len(names)
+        if len(abilities) != len(names):
+            raise GameRuleError("플레이어마다 찬스를 하나씩 지정해야 합니다.")
+        self.players = [PlayerState(name, key) for name, key in zip(names, abilities)]
+        self.ability_key = ability_key
+        self.current_player_index = 0
+        self.dice = [0] * DICE_COUNT
+        self.held = [False] * DICE_COUNT
+        self.rolls_left = ROLLS_PER_TURN
+        self.reset_progress()
+
+    def reset_progress(self) -> None:
+        self.turns_left = len(self.players) * len(CATEGORIES)
+        self.best_total = 0
+        self.leaders = set(range(len(self.players)))
+
+    @property
+    def current_player(self) -> PlayerState:
+        return self.players[self.current_player_index]
+
+    @property
+    def current_ability_key(self) -> str:
+        return self.current_player.ability_key or self.ability_key
+
+    @property
+    def dice_rolled(self) -> bool:
+        return any(value > 0 for value in self.dice)
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.players) and self.turns_left == 0
+
+
+class GameEngine:
+    __slots__ = ("state", "rng")
+
+    def __init__(
+        self,
+        names=(),
+        ability_key: str = "reroll_selected",
+        seed: int | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.state = GameState(names, ability_key)
+        self.rng = rng or random.Random(seed)
+
+    def new_game(self, names, ability_key: str | None = None, player_abilities=None) -> None:
+        self.state = GameState(names, ability_key or self.state.ability_key, player_abilities)
+        self.start_turn()
+
+    def restart(self) -> None:
+        for player in self.state.players:
+            player.reset()
+        self.state.reset_progress()
+        self.state.current_player_index = 0
+        self.start_turn()
+
+    def start_turn(self) -> None:
+        state = self.state
+        state.dice = [0] * DICE_COUNT
+        state.held = [False] * DICE_COUNT
+        state.rolls_left = ROLLS_PER_TURN
+
+    def roll(self) -> list[int]:
+        state = self.state
+        if state.rolls_left <= 0:
+            raise GameRuleError("더 이상 굴릴 수 없습니다. 카테고리를 선택하세요.")
+        randint = self.rng.randint
+        dice = state.dice
+        held = state.held
+        for idx in range(DICE_COUNT):
+            if not held[idx]:
+                dice[idx] = randint(1, 6)
+        state.rolls_left -= 1
+        return dice
+
+    def toggle_hold(self, index: int) -> bool:
+        state = self.state
+        if state.dice[index] == 0:
+            return False
+        state.held[index] = not state.held[index]
+        return True
+
+    def set_held(self, held: list[bool]) -> None:
+        state = self.state
+        state.held = [bool(flag) and value > 0 for flag, value in zip(held, state.dice)]
+
+    def expected_scores(self) -> tuple[int, ...]:
+        return score_all(self.state.dice)
+
+    def use_ability(self, *args) -> None:
+        state = self.state
+        player = state.current_player
+        if player.ability_used:
+            raise GameRuleError("이미 찬스를 사용했습니다.")
+        ability_key = state.current_ability_key
+        handler = ABILITY_HANDLERS.get(ability_key)
+        if handler is None:
+            raise GameRuleError("사용할 수 있는 찬스가 없습니다.")
+        if ability_key != "add_five_points" and not state.dice_rolled:
+            raise GameRuleError("먼저 주사위를 굴려주세요.")
+        handler(self, *args)
+        player.ability_used = True
+
+    def set_die_to_six(self, index: int) -> None:
+        self._check_positions([index])
+        self.state.dice[index] = 6
+
+    def reroll_selected(self, indices: list[int]) -> None:
+        if len(indices) == 0 or len(indices) > 2:
+            raise GameRuleError("최대 2개의 주사위를 선택할 수 있습니다.")
+        self._check_positions(indices)
+        state = self.state
+        for idx in indices:
+            state.held[idx] = False
+            state.dice[idx] = self.rng.randint(1, 6)
+
+    def add_five_points(self) -> None:
+        self.state.current_player.pending_bonus += RAIN_BONUS
+
+    def swap_dice(self, first: int, second: int) -> None:
+        self._check_positions([first, second])
+        dice = self.state.dice
+        dice[first], dice[second] = dice[second], dice[first]
+
+    def full_reroll(self) -> None:
+        state = self.state
+        state.held = [False] * DICE_COUNT
+        randint = self.rng.randint
+        state.dice = [randint(1, 6) for _ in range(DICE_COUNT)]
+
+    def _check_positions(self, indices) -> None:
+        for idx in indices:
+            if idx < 0 or idx >= DICE_COUNT:
+                raise GameRuleError("주사위 위치는 1에서 5 사이입니다.")
+
+    def record_score(self, category: str) -> int:
+        state = self.state
+        player = state.current_player
+        if category in player.scores:
+            raise GameRuleError("이미 기록한 카테고리입니다.")
+        if not state.dice_rolled:
+            raise GameRuleError("먼저 주사위를 굴려주세요.")
+
+        index = CATEGORY_INDEX[category]
+        score = score_all(state.dice)[index] + player.pending_bonus
+        player.pending_bonus = 0
+        player.scores[category] = score
+        player.total += score
+        player.filled += 1
+        player.filled_mask |= 1 << index
+        state.turns_left -= 1
+
+        if player.total > state.best_total:
+            state.best_total = player.total
+            state.leaders = {state.current_player_index}
+        elif player.total == state.best_total:
+            state.leaders.add(state.current_player_index)
+        return score
+
+    def advance_turn(self) -> bool:
+        state = self.state
+        if state.finished:
+            return True
+        state.current_player_index = (state.current_player_index + 1) % len(state.players)
+        self.start_turn()
+        return False
+
+    def winners(self) -> tuple[list[PlayerState], int]:
+        state = self.state
+        return [state.players[idx] for idx in sorted(state.leaders)], state.best_total
+
+
+ABILITY_HANDLERS = {
+    "set_die_to_six": GameEngine.set_die_to_six,
+    "reroll_selected": GameEngine.reroll_selected,
+    "add_five_points": GameEngine.add_five_points,
+    "swap_dice": GameEngine.swap_dice,
+    "full_reroll": GameEngine.full_reroll,
+}
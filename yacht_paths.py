@@ -0,0 +1,18 @@
+import os
+import sys
+from pathlib import Path
+
+DATA_DIR_ENV = "WEATHER_YACHT_DATA_DIR"
+
+
+def user_data_dir() -> Path:
+    override = os.environ.get(DATA_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"
+        return Path(base) / "WeatherYacht"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "WeatherYacht"
+    base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "weather-yacht"
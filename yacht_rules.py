@@ -0,0 +1,165 @@
+import itertools
+from collections import Counter
+
+
+CATEGORIES = [
+    ("ones", "1의 합"),
+    ("twos", "2의 합"),
+    ("threes", "3의 합"),
+    ("fours", "4의 합"),
+    ("fives", "5의 합"),
+    ("sixes", "6의 합"),
+    ("four_kind", "포카드"),
+    ("full_house", "풀하우스"),
+    ("small_straight", "스몰 스트레이트"),
+    ("large_straight", "라지 스트레이트"),
+    ("yacht", "야추"),
+    ("chance", "찬스"),
+]
+CATEGORY_DISPLAY_MAP = {code: display for code, display in CATEGORIES}
+CATEGORY_INDEX = {code: idx for idx, (code, _) in enumerate(CATEGORIES)}
+
+RAIN_BONUS = 5
+
+WEATHER_THEMES = {
+    "sunny": {
+        "bg": "#ffe27a",
+        "fg": "#2c2100",
+        "ability_name": "햇살 찬스",
+        "ability_desc": "이번 턴에 원하는 주사위 하나를 6으로 바꿀 수 있습니다.",
+        "ability_key": "set_die_to_six",
+    },
+    "cloudy": {
+        "bg": "#d6e4f0",
+        "fg": "#1f2a44",
+        "ability_name": "바람 찬스",
+        "ability_desc": "선택한 주사위 두 개까지 다시 굴립니다.",
+        "ability_key": "reroll_selected",
+    },
+    "rain": {
+        "bg": "#9ec5f8",
+        "fg": "#132d4b",
+        "ability_name": "빗방울 찬스",
+        "ability_desc": "이번 점수에 +5점을 추가합니다.",
+        "ability_key": "add_five_points",
+    },
+    "snow": {
+        "bg": "#f3f8ff",
+        "fg": "#2a2f36",
+        "ability_name": "눈꽃 찬스",
+        "ability_desc": "선택한 주사위 두 개의 값을 서로 바꿉니다.",
+        "ability_key": "swap_dice",
+    },
+    "storm": {
+        "bg": "#494166",
+        "fg": "#f1f1f1",
+        "ability_name": "번개 찬스",
+        "ability_desc": "주사위 전체를 한 번 더 굴립니다 (굴림 횟수 무시).",
+        "ability_key": "full_reroll",
+    },
+}
+
+
+def classify_weather(code: int) -> str:
+    if code in {0}:
+        return "sunny"
+    if code in {1, 2, 3, 45, 48}:
+        return "cloudy"
+    if code in {51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82}:
+        return "rain"
+    if code in {71, 73, 75, 77, 85, 86}:
+        return "snow"
+    if code in {95, 96, 99}:
+        return "storm"
+    return "cloudy"
+
+
+ROLL_PLACE_VALUES = (1296, 216, 36, 6, 1)
+ROLL_INDEX_OFFSET = sum(ROLL_PLACE_VALUES)
+ZERO_SCORES = (0,) * len(CATEGORIES)
+
+_roll_to_multiset: bytes | None = None
+_multiset_scores: list[tuple[int, ...]] = []
+
+
+def _score_category(category: str, dice: list[int]) -> int:
+    counts = Counter(dice)
+    total = sum(dice)
+    if category == "ones":
+        return dice.count(1)
+    if category == "twos":
+        return 2 * dice.count(2)
+    if category == "threes":
+        return 3 * dice.count(3)
+    if category == "fours":
+        return 4 * dice.count(4)
+    if category == "fives":
+        return 5 * dice.count(5)
+    if category == "sixes":
+        return 6 * dice.count(6)
+    if category == "four_kind":
+        for value, count in counts.items():
+            if count >= 4:
+                return total
+        return 0
+    if category == "full_house":
+        if sorted(counts.values()) == [2, 3]:
+            return 25
+        return 0
+    if category == "small_straight":
+        unique = sorted(set(dice))
+        straights = [{1, 2, 3, 4}, {2, 3, 4, 5}, {3, 4, 5, 6}]
+        for straight in straights:
+            if straight.issubset(unique):
+                return 30
+        return 0
+    if category == "large_straight":
+        if set(dice) in ({1, 2, 3, 4, 5}, {2, 3, 4, 5, 6}):
+            return 40
+        return 0
+    if category == "yacht":
+        if len(counts) == 1:
+            return 50
+        return 0
+    if category == "chance":
+        return total
+    return 0
+
+
+def _build_score_tables() -> bytes:
+    global _roll_to_multiset, _multiset_scores
+    multiset_ids: dict[tuple[int, ...], int] = {}
+    rows: list[tuple[int, ...]] = []
+    for dice in itertools.combinations_with_replacement(range(1, 7), 5):
+        multiset_ids[dice] = len(rows)
+        rows.append(tuple(_score_category(code, dice) for code, _ in CATEGORIES))
+    _multiset_scores = rows
+    _roll_to_multiset = bytes(
+        multiset_ids[tuple(sorted(roll))] for roll in itertools.product(range(1, 7), repeat=5)
+    )
+    return _roll_to_multiset
+
+
+def score_tables() -> tuple[bytes, list[tuple[int, ...]]]:
+    table = _roll_to_multiset or _build_score_tables()
+    return table, _multiset_scores
+
+
+def roll_index(dice) -> int:
+    return (
+        dice[0] * 1296 + dice[1] * 216 + dice[2] * 36 + dice[3] * 6 + dice[4] - ROLL_INDEX_OFFSET
+    )
+
+
+def score_all(dice) -> tuple[int, ...]:
+    if len(dice) != 5 or min(dice) < 1 or max(dice) > 6:
+        return ZERO_SCORES
+    table = _roll_to_multiset or _build_score_tables()
+    return _multiset_scores[table[roll_index(dice)]]
+
+
+def calculate_score(category: str, dice: list[int]) -> int:
+    index = CATEGORY_INDEX.get(category)
+    if index is None:
+        return 0
+    return score_all(dice)[index]
@@ -0,0 +1,330 @@
+import hashlib
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+
+from yacht_rules import CATEGORIES, CATEGORY_INDEX, RAIN_BONUS, WEATHER_THEMES, score_all
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+CATEGORY_COUNT = len(CATEGORIES)
+MASK_COUNT = 1 << CATEGORY_COUNT
+FULL_MASK = MASK_COUNT - 1
+STAGE_COUNT = 3
+
+MULTISETS = tuple(itertools.combinations_with_replacement(range(1, 7), 5))
+MULTISET_ID = {dice: idx for idx, dice in enumerate(MULTISETS)}
+KEEPS = tuple(
+    keep
+    for size in range(6)
+    for keep in itertools.combinations_with_replacement(range(1, 7), size)
+)
+KEEP_ID = {keep: idx for idx, keep in enumerate(KEEPS)}
+EMPTY_KEEP = KEEP_ID[()]
+
+ACTION_KEEP_BASE = CATEGORY_COUNT
+ACTION_ABILITY_BASE = ACTION_KEEP_BASE + len(KEEPS)
+
+ABILITY_KEYS = tuple(theme["ability_key"] for theme in WEATHER_THEMES.values())
+
+STRATEGY_FORMAT_VERSION = 1
+STRATEGY_ARRAYS = ("turn_values", "state_values", "actions")
+
+_transitions = None
+
+
+class DiceTransitions:
+    def __init__(self) -> None:
+        self.keep_to_roll = np.zeros((len(KEEPS), len(MULTISETS)))
+        for keep_id, keep in enumerate(KEEPS):
+            outcomes = list(itertools.product(range(1, 7), repeat=5 - len(keep)))
+            weight = 1.0 / len(outcomes)
+            for outcome in outcomes:
+                self.keep_to_roll[keep_id, MULTISET_ID[tuple(sorted(keep + outcome))]] += weight
+        self.roll_to_keep = np.ascontiguousarray(self.keep_to_roll.T)
+
+        keeps_of = []
+        partial_keeps_of = []
+        six_of = []
+        for dice in MULTISETS:
+            subsets = {
+                size: {
+                    KEEP_ID[tuple(dice[i] for i in positions)]
+                    for positions in itertools.combinations(range(5), size)
+                }
+                for size in range(6)
+            }
+            keeps_of.append(sorted(set().union(*subsets.values())))
+            partial_keeps_of.append(sorted(subsets[3] | subsets[4]))
+            six_of.append(
+                [MULTISET_ID[tuple(sorted(dice[:i] + (6,) + dice[i + 1:]))] for i in range(5)]
+            )
+        self.keeps_of = _padded(keeps_of)
+        self.partial_keeps_of = _padded(partial_keeps_of)
+        self.six_of = np.array(six_of, dtype=np.intp)
+        self.faces = np.array(MULTISETS, dtype=np.int16)
+        self.scores = np.array([score_all(dice) for dice in MULTISETS], dtype=np.float64)
+
+        masks = np.arange(MASK_COUNT)
+        bits = 1 << np.arange(CATEGORY_COUNT)
+        self.open = (masks[:, None] & bits[None, :]) == 0
+        self.next_mask = masks[:, None] | bits[None, :]
+        fill_counts = np.array([bin(mask).count("1") for mask in range(MASK_COUNT)])
+        self.masks_by_fill = [np.flatnonzero(fill_counts == count) for count in range(CATEGORY_COUNT + 1)]
+
+
+def _padded(rows: list[list[int]]):
+    width = max(len(row) for row in rows)
+    return np.array([row + [row[0]] * (width - len(row)) for row in rows], dtype=np.intp)
+
+
+def dice_transitions() -> DiceTransitions:
+    global _transitions
+    if np is None:
+        raise RuntimeError("최적 전략 계산에는 numpy가 필요합니다.")
+    if _transitions is None:
+        _transitions = DiceTransitions()
+    return _transitions
+
+
+def category_mask(categories) -> int:
+    mask = 0
+    for code in categories:
+        mask |= 1 << CATEGORY_INDEX[code]
+    return mask
+
+
+class StrategyTable:
+    def __init__(self, ability_key: str | None, turn_values, state_values, actions) -> None:
+        self.ability_key = ability_key
+        self.turn_values = turn_values
+        self.state_values = state_values
+        self.actions = actions
+
+    def expected_score(self, filled_mask: int = 0, ability_available: bool = True) -> float:
+        return float(self.turn_values[int(ability_available), filled_mask])
+
+    def lookup(
+        self,
+        filled_mask: int,
+        ability_available: bool,
+        rolls_left: int,
+        dice: list[int],
+    ) -> tuple[float, int]:
+        index = (int(ability_available), rolls_left, filled_mask, MULTISET_ID[tuple(sorted(dice))])
+        return float(self.state_values[index]), int(self.actions[index])
+
+    def describe_action(self, action: int, dice: list[int]) -> dict:
+        if action < ACTION_KEEP_BASE:
+            return {"kind": "score", "category": CATEGORIES[action][0]}
+        if action < ACTION_ABILITY_BASE:
+            return {"kind": "reroll", "held": hold_positions(dice, KEEPS[action - ACTION_KEEP_BASE])}
+
+        argument = action - ACTION_ABILITY_BASE
+        positions: list[int] = []
+        if self.ability_key == "set_die_to_six":
+            positions = [dice.index(argument)]
+        elif self.ability_key == "reroll_selected":
+            held = hold_positions(dice, KEEPS[argument])
+            positions = [idx for idx, keep in enumerate(held) if not keep]
+        return {"kind": "ability", "ability_key": self.ability_key, "positions": positions}
+
+    def best_action(
+        self,
+        filled_mask: int,
+        ability_available: bool,
+        rolls_left: int,
+        dice: list[int],
+    ) -> dict:
+        _, action = self.lookup(filled_mask, ability_available, rolls_left, dice)
+        return self.describe_action(action, dice)
+
+
+def hold_positions(dice: list[int], keep: tuple[int, ...]) -> list[bool]:
+    remaining = list(keep)
+    held = []
+    for value in dice:
+        if value in remaining:
+            remaining.remove(value)
+            held.append(True)
+        else:
+            held.append(False)
+    return held
+
+
+def _ability_option(transitions: DiceTransitions, ability_key: str | None, used_values):
+    rows = np.arange(len(MULTISETS))
+    if ability_key == "set_die_to_six":
+        candidates = used_values[:, transitions.six_of]
+        best = candidates.argmax(axis=2)
+        return (
+            np.take_along_axis(candidates, best[..., None], axis=2)[..., 0],
+            transitions.faces[rows, best],
+        )
+    if ability_key == "reroll_selected":
+        keep_values = used_values @ transitions.roll_to_keep
+        candidates = keep_values[:, transitions.partial_keeps_of]
+        best = candidates.argmax(axis=2)
+        return (
+            np.take_along_axis(candidates, best[..., None], axis=2)[..., 0],
+            transitions.partial_keeps_of[rows, best],
+        )
+    if ability_key == "full_reroll":
+        keep_values = used_values @ transitions.keep_to_roll[EMPTY_KEEP]
+        return np.broadcast_to(keep_values[:, None], used_values.shape), 0
+    if ability_key == "add_five_points":
+        return used_values + RAIN_BONUS, 0
+    if ability_key == "swap_dice":
+        return used_values, 0
+    return None, 0
+
+
+def _solve_level(transitions: DiceTransitions, ability_key, masks, turn_values, state_values, actions) -> None:
+    open_categories = transitions.open[masks][:, None, :]
+    next_masks = transitions.next_mask[masks]
+    score_best = []
+    score_action = []
+    for available in (0, 1):
+        category_values = transitions.scores[None, :, :] + turn_values[available][next_masks][:, None, :]
+        category_values = np.where(open_categories, category_values, -np.inf)
+        best = category_values.argmax(axis=2)
+        score_best.append(np.take_along_axis(category_values, best[..., None], axis=2)[..., 0])
+        score_action.append(best)
+
+    stage_values: list[list] = [[None] * STAGE_COUNT for _ in range(2)]
+    for stage in range(STAGE_COUNT):
+        for available in (0, 1):
+            values = score_best[available]
+            chosen = score_action[available]
+            if stage > 0:
+                keep_values = stage_values[available][stage - 1] @ transitions.roll_to_keep
+                candidates = keep_values[:, transitions.keeps_of]
+                best = candidates.argmax(axis=2)
+                reroll_values = np.take_along_axis(candidates, best[..., None], axis=2)[..., 0]
+                better = reroll_values > values
+                values = np.where(better, reroll_values, values)
+                keep_ids = transitions.keeps_of[np.arange(len(MULTISETS)), best]
+                chosen = np.where(better, ACTION_KEEP_BASE + keep_ids, chosen)
+            if available:
+                ability_values, argument = _ability_option(
+                    transitions, ability_key, stage_values[0][stage]
+                )
+                if ability_values is not None:
+                    if ability_key == "add_five_points":
+                        better = ability_values >= values
+                    else:
+                        better = ability_values > values + 1e-9
+                    values = np.where(better, ability_values, values)
+                    chosen = np.where(better, ACTION_ABILITY_BASE + argument, chosen)
+            stage_values[available][stage] = values
+            state_values[available, stage, masks] = values
+            actions[available, stage, masks] = chosen
+
+    first_roll = transitions.keep_to_roll[EMPTY_KEEP]
+    for available in (0, 1):
+        turn_values[available, masks] = stage_values[available][STAGE_COUNT - 1] @ first_roll
+
+
+def solve(ability_key: str | None = None) -> StrategyTable:
+    transitions = dice_transitions()
+    turn_values = np.zeros((2, MASK_COUNT))
+    shape = (2, STAGE_COUNT, MASK_COUNT, len(MULTISETS))
+    state_values = np.zeros(shape, dtype=np.float32)
+    actions = np.zeros(shape, dtype=np.int16)
+    for filled in range(CATEGORY_COUNT - 1, -1, -1):
+        _solve_level(
+            transitions,
+            ability_key,
+            transitions.masks_by_fill[filled],
+            turn_values,
+            state_values,
+            actions,
+        )
+    return StrategyTable(ability_key, turn_values, state_values, actions)
+
+
+def rules_fingerprint() -> str:
+    digest = hashlib.sha1()
+    digest.update(repr([code for code, _ in CATEGORIES]).encode())
+    digest.update(repr([score_all(dice) for dice in MULTISETS]).encode())
+    digest.update(repr((STAGE_COUNT, RAIN_BONUS)).encode())
+    return digest.hexdigest()[:10]
+
+
+def strategy_dir(base: Path) -> Path:
+    return Path(base) / f"strategy-v{STRATEGY_FORMAT_VERSION}-{rules_fingerprint()}"
+
+
+def _strategy_path(directory: Path, ability_key: str | None, array_name: str) -> Path:
+    return Path(directory) / f"{ability_key or 'none'}.{array_name}.npy"
+
+
+def save_strategy(table: StrategyTable, directory: Path) -> None:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for array_name in STRATEGY_ARRAYS:
+        path = _strategy_path(directory, table.ability_key, array_name)
+        partial = path.with_suffix(".tmp")
+        with open(partial, "wb") as handle:
+            np.save(handle, getattr(table, array_name))
+        os.replace(partial, path)
+
+
+def load_strategy(ability_key: str | None, directory: Path) -> StrategyTable | None:
+    if np is None:
+        return None
+    try:
+        arrays = [
+            np.load(_strategy_path(directory, ability_key, array_name), mmap_mode="r")
+            for array_name in STRATEGY_ARRAYS
+        ]
+    except (OSError, ValueError):
+        return None
+    shape = (2, STAGE_COUNT, MASK_COUNT, len(MULTISETS))
+    if arrays[0].shape != (2, MASK_COUNT) or arrays[1].shape != shape or arrays[2].shape != shape:
+        return None
+    return StrategyTable(ability_key, *arrays)
+
+
+def load_or_solve(ability_key: str | None, directory: Path) -> StrategyTable:
+    table = load_strategy(ability_key, directory)
+    if table is not None:
+        return table
+    table = solve(ability_key)
+    try:
+        save_strategy(table, directory)
+    except OSError:
+        return table
+    return load_strategy(ability_key, directory) or table
+
+
+def main() -> None:
+    if np is None:
+        print("최적 전략 계산에는 numpy가 필요합니다.", file=sys.stderr)
+        sys.exit(1)
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    started = time.perf_counter()
+    dice_transitions()
+    print(f"transitions: {time.perf_counter() - started:.2f}s")
+    for condition, theme in WEATHER_THEMES.items():
+        started = time.perf_counter()
+        table = solve(theme["ability_key"])
+        if output is not None:
+            save_strategy(table, strategy_dir(output))
+        elapsed = time.perf_counter() - started
+        print(
+            f"{condition:>6} ({theme['ability_key']}): "
+            f"기대 점수 {table.expected_score():.2f}, "
+            f"찬스 없이 {table.expected_score(ability_available=False):.2f}, "
+            f"{elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+import argparse
+import importlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from yacht_engine import GameEngine
+from yacht_paths import user_data_dir
+from yacht_rules import CATEGORIES, CATEGORY_INDEX, WEATHER_THEMES
+
+DEFAULT_GAMES = 2000
+DEFAULT_CHUNK_SIZE = 250
+
+
+class RandomBot:
+    def __init__(self, ability_key: str, rng: random.Random, strategy_dir: str | None = None) -> None:
+        self.ability_key = ability_key
+        self.rng = rng
+
+    def play_turn(self, engine: GameEngine) -> None:
+        player = engine.state.current_player
+        engine.roll()
+        open_codes = [code for code, _ in CATEGORIES if code not in player.scores]
+        engine.record_score(self.rng.choice(open_codes))
+
+
+class GreedyBot:
+    def __init__(self, ability_key: str, rng: random.Random, strategy_dir: str | None = None) -> None:
+        self.ability_key = ability_key
+        self.rng = rng
+
+    def best_open(self, engine: GameEngine) -> tuple[str, int]:
+        scores = engine.expected_scores()
+        player = engine.state.current_player
+        return max(
+            ((code, scores[CATEGORY_INDEX[code]]) for code, _ in CATEGORIES if code not in player.scores),
+            key=lambda item: item[1],
+        )
+
+    def choose_held(self, dice: list[int]) -> list[bool]:
+        faces = set(dice)
+        for run in ((1, 2, 3, 4, 5), (2, 3, 4, 5, 6), (1, 2, 3, 4), (2, 3, 4, 5), (3, 4, 5, 6)):
+            if faces.issuperset(run):
+                remaining = list(run)
+                held = []
+                for value in dice:
+                    held.append(value in remaining)
+                    if value in remaining:
+                        remaining.remove(value)
+                return held
+        counts = Counter(dice)
+        face = max(counts, key=lambda value: (counts[value], value))
+        return [value == face for value in dice]
+
+    def play_turn(self, engine: GameEngine) -> None:
+        state = engine.state
+        player = state.current_player
+        if self.ability_key == "add_five_points" and not player.ability_used:
+            engine.use_ability()
+
+        engine.roll()
+        while state.rolls_left > 0 and self.best_open(engine)[1] < 30:
+            engine.set_held(self.choose_held(state.dice))
+            engine.roll()
+
+        if not player.ability_used:
+            self.try_ability(engine)
+        engine.record_score(self.best_open(engine)[0])
+
+    def try_ability(self, engine: GameEngine) -> None:
+        state = engine.state
+        _, current = self.best_open(engine)
+        if self.ability_key == "set_die_to_six":
+            best_gain, best_index = 0, None
+            for idx, value in enumerate(state.dice):
+                if value == 6:
+                    continue
+                state.dice[idx] = 6
+                gain = self.best_open(engine)[1] - current
+                state.dice[idx] = value
+                if gain > best_gain:
+                    best_gain, best_index = gain, idx
+            if best_index is not None:
+                engine.use_ability(best_index)
+        elif self.ability_key == "reroll_selected" and current < 20:
+            held = self.choose_held(state.dice)
+            loose = [idx for idx, keep in enumerate(held) if not keep][:2]
+            if loose:
+                engine.use_ability(loose)
+        elif self.ability_key == "full_reroll" and current == 0:
+            engine.use_ability()
+
+
+class OptimalBot:
+    def __init__(self, ability_key: str, rng: random.Random, strategy_dir: str | None = None) -> None:
+        solver = importlib.import_module("yacht_solver")
+        self.ability_key = ability_key
+        self.table = solver.load_or_solve(ability_key, Path(strategy_dir)) if strategy_dir else solver.solve(ability_key)
+
+    def play_turn(self, engine: GameEngine) -> None:
+        state = engine.state
+        player = state.current_player
+        engine.roll()
+        while True:
+            hint = self.table.best_action(
+                player.filled_mask,
+                not player.ability_used,
+                state.rolls_left,
+                state.dice,
+            )
+            if hint["kind"] == "score":
+                engine.record_score(hint["category"])
+                return
+            if hint["kind"] == "reroll":
+                engine.set_held(hint["held"])
+                engine.roll()
+            elif self.ability_key == "set_die_to_six":
+                engine.use_ability(hint["positions"][0])
+            elif self.ability_key == "reroll_selected":
+                engine.use_ability(hint["positions"])
+            elif self.ability_key == "swap_dice":
+                engine.use_ability(0, 1)
+            else:
+                engine.use_ability()
+
+
+BOTS = {
+    "random": RandomBot,
+    "greedy": GreedyBot,
+    "optimal": OptimalBot,
+}
+
+
+def load_bot(spec: str):
+    if spec in BOTS:
+        return BOTS[spec]
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"알 수 없는 봇입니다: {spec} (예: random, greedy, optimal, package.module:ClassName)")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ScoreSummary:
+    def __init__(self) -> None:
+        self.histogram: Counter = Counter()
+        self.games = 0
+        self.total = 0
+        self.total_squared = 0
+
+    def add(self, histogram: dict[int, int]) -> None:
+        for score, count in histogram.items():
+            self.histogram[score] += count
+            self.games += count
+            self.total += score * count
+            self.total_squared += score * score * count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.games if self.games else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if self.games < 2:
+            return 0.0
+        variance = (self.total_squared - self.total * self.total / self.games) / (self.games - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def percentile(self, fraction: float) -> int:
+        target = fraction * self.games
+        seen = 0
+        for score in sorted(self.histogram):
+            seen += self.histogram[score]
+            if seen >= target:
+                return score
+        return 0
+
+    def as_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "mean": round(self.mean, 3),
+            "stdev": round(self.stdev, 3),
+            "p10": self.percentile(0.1),
+            "median": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "max": max(self.histogram, default=0),
+            "histogram": {str(score): count for score, count in sorted(self.histogram.items())},
+        }
+
+
+def play_games(bot_spec: str, ability_key: str, seed: str, games: int, strategy_dir: str | None) -> Counter:
+    rng = random.Random(seed)
+    bot = load_bot(bot_spec)(ability_key, rng, strategy_dir)
+    engine = GameEngine(["bot"], ability_key, rng=rng)
+    player = engine.state.players[0]
+    histogram: Counter = Counter()
+    for _ in range(games):
+        engine.restart()
+        while True:
+            bot.play_turn(engine)
+            if engine.advance_turn():
+                break
+        histogram[player.total] += 1
+    return histogram
+
+
+def run_tournament(
+    bots: list[str],
+    conditions: list[str],
+    games: int = DEFAULT_GAMES,
+    workers: int | None = None,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    strategy_dir: str | None = None,
+    progress=None,
+) -> dict[tuple[str, str], ScoreSummary]:
+    jobs = []
+    for condition in conditions:
+        ability_key = WEATHER_THEMES[condition]["ability_key"]
+        for bot_spec in bots:
+            for chunk, start in enumerate(range(0, games, chunk_size)):
+                count = min(chunk_size, games - start)
+                jobs.append(((condition, bot_spec), (bot_spec, ability_key, f"{seed}:{condition}:{bot_spec}:{chunk}", count, strategy_dir)))
+
+    summaries = {key: ScoreSummary() for key, _ in jobs}
+    if workers == 0:
+        for done, (key, args) in enumerate(jobs, start=1):
+            summaries[key].add(play_games(*args))
+            if progress is not None:
+                progress(done, len(jobs))
+        return summaries
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(play_games, *args): key for key, args in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            summaries[futures[future]].add(future.result())
+            if progress is not None:
+                progress(done, len(jobs))
+    return summaries
+
+
+def prepare_strategy_tables(bots: list[str], conditions: list[str], strategy_dir: str | None) -> str | None:
+    if "optimal" not in bots:
+        return strategy_dir
+    solver = importlib.import_module("yacht_solver")
+    if solver.np is None:
+        raise SystemExit("optimal 봇을 사용하려면 numpy가 필요합니다.")
+    if strategy_dir is None:
+        strategy_dir = str(solver.strategy_dir(user_data_dir()))
+    for condition in conditions:
+        solver.load_or_solve(WEATHER_THEMES[condition]["ability_key"], Path(strategy_dir))
+    return strategy_dir
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Weather Yacht 봇 토너먼트 (날씨 찬스 밸런스 측정)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="날씨 조건/봇마다 진행할 게임 수")
+    parser.add_argument("--bots", default="greedy,random", help="쉼표로 구분한 봇 목록 (random, greedy, optimal, module:Class)")
+    parser.add_argument("--conditions", default=",".join(WEATHER_THEMES), help="쉼표로 구분한 날씨 조건")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (0이면 단일 프로세스)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--strategy-dir", default=None, help="optimal 봇이 사용할 전략 표 폴더")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    bots = [name.strip() for name in args.bots.split(",") if name.strip()]
+    conditions = [name.strip() for name in args.conditions.split(",") if name.strip()]
+    unknown = [name for name in conditions if name not in WEATHER_THEMES]
+    if unknown:
+        parser.error(f"알 수 없는 날씨 조건: {', '.join(unknown)}")
+
+    strategy_dir = prepare_strategy_tables(bots, conditions, args.strategy_dir)
+
+    def report_progress(done: int, total: int) -> None:
+        print(f"\r진행 {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    summaries = run_tournament(
+        bots,
+        conditions,
+        games=args.games,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        strategy_dir=strategy_dir,
+        progress=report_progress,
+    )
+    elapsed = time.perf_counter() - started
+    print(file=sys.stderr)
+
+    print(f"{'조건':<8}{'찬스':<18}{'봇':<10}{'게임':>8}{'평균':>9}{'표준편차':>9}{'p10':>6}{'중앙값':>7}{'p90':>6}")
+    for (condition, bot_spec), summary in summaries.items():
+        print(
+            f"{condition:<8}{WEATHER_THEMES[condition]['ability_key']:<18}{bot_spec:<10}"
+            f"{summary.games:>8}{summary.mean:>9.2f}{summary.stdev:>9.2f}"
+            f"{summary.percentile(0.1):>6}{summary.percentile(0.5):>7}{summary.percentile(0.9):>6}"
+        )
+    total_games = sum(summary.games for summary in summaries.values())
+    print(f"{total_games}게임, {elapsed:.1f}초 ({total_games / elapsed:.0f}게임/초, 프로세스 {args.workers or os.cpu_count()}개)")
+
+    if args.json_path:
+        payload = {
+            "seed": args.seed,
+            "elapsed": round(elapsed, 3),
+            "results": [
+                {"condition": condition, "bot": bot_spec, **summary.as_dict()}
+                for (condition, bot_spec), summary in summaries.items()
+            ],
+        }
+        Path(args.json_path).write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()